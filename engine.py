@@ -0,0 +1,1938 @@
+import numpy as np
+import networkx as nx
+from enum import Enum
+from functools import lru_cache, partial
+import multiprocessing
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from geotypes import create_geotype
+from fiber_plant import FiberPlant
+from wavelength_assignment import WavelengthAssigner
+from traffic_profile import hourly_energy
+
+# Enum definition for Radio Equipment types
+class RadioEquipmentTypeEnum(Enum):
+    MACRO_SUB_GHZ = "Macro sub GHz"
+    MACRO_1_3_GHZ = "Macro 1-3 GHz"
+    MACRO_3_7_GHZ = "Macro 3-7 GHz"
+    MACRO_24_46_GHZ = "Macro 24-46 GHz"
+    SMALL_3_7_GHZ = "Small 3-7 GHz"
+    SMALL_7_15_GHZ = "Small 7-15 GHz"
+    SMALL_24_46_GHZ = "Small 24-46 GHz"
+
+
+# RadioEquipmentType class definition
+class RadioEquipmentType:
+    def __init__(self, bands_range, num_bands_mt, num_bands_lt, service, single_carrier_width, numerology, deployment):
+        self.bands_range = bands_range
+        self.num_bands_mt = num_bands_mt
+        self.num_bands_lt = num_bands_lt
+        self.service = service
+        self.single_carrier_width = single_carrier_width
+        self.numerology = numerology
+        self.deployment = deployment  # New deployment field (Macro or Small)
+
+
+# Global definition of radio equipment types
+radio_equipment_types = {
+    RadioEquipmentTypeEnum.MACRO_SUB_GHZ: RadioEquipmentType("Sub GHz", 4, 4, "mobile", 10, 0, "Macro"),
+    RadioEquipmentTypeEnum.MACRO_1_3_GHZ: RadioEquipmentType("1-3 GHz", 4, 4, "mobile", 20, 0, "Macro"),
+    RadioEquipmentTypeEnum.MACRO_3_7_GHZ: RadioEquipmentType("3-7 GHz", 2, 2, "Mob.&FWA", 100, 1, "Macro"),
+    RadioEquipmentTypeEnum.MACRO_24_46_GHZ: RadioEquipmentType("24-46 GHz", 1, 1, "FWA", 200, 3, "Macro"),
+    RadioEquipmentTypeEnum.SMALL_3_7_GHZ: RadioEquipmentType("3-7 GHz", 2, 3, "mobile", 100, 1, "Small"),
+    RadioEquipmentTypeEnum.SMALL_7_15_GHZ: RadioEquipmentType("7-15 GHz", 0, 1, "mobile", 200, 2, "Small"),
+    RadioEquipmentTypeEnum.SMALL_24_46_GHZ: RadioEquipmentType("24-46 GHz", 1, 2, "mobile", 200, 3, "Small")
+}
+
+
+class RadioEquipment:
+    def __init__(self, equipment_type_enum):
+        spec = radio_equipment_types[equipment_type_enum]
+        self.equipment_type = equipment_type_enum
+        self.bands_range = spec.bands_range
+        self.num_bands_mt = spec.num_bands_mt
+        self.num_bands_lt = spec.num_bands_lt
+        self.service = spec.service
+        self.single_carrier_width = spec.single_carrier_width
+        self.numerology = spec.numerology
+
+        # Add deployment property based on the equipment type
+        self.deployment = "Macro" if "MACRO" in equipment_type_enum.name else "Small"
+
+    def calculate_required_capacity(self, term):
+        term_factor = {'short': 1, 'Medium': 2, 'Long': 3}
+        factor = term_factor.get(term, 1)
+
+        if self.deployment == "Macro":
+            MIMO = 4
+            multiplier = 0.27 * MIMO
+            if term == 'Medium':
+                return multiplier * self.num_bands_mt * self.single_carrier_width / 10
+            elif term == 'Long':
+                return multiplier * self.num_bands_lt * self.single_carrier_width / 10
+            else:
+                return 0
+        elif self.deployment == "Small":
+            MIMO = 4
+            multiplier = 0.27 * MIMO
+            if term == 'Medium':
+                return multiplier * self.num_bands_mt * self.single_carrier_width / 10
+            elif term == 'Long':
+                return multiplier * self.num_bands_lt * self.single_carrier_width / 10
+            else:
+                return 0
+
+
+# Enum definition for Network Equipment types
+class NetworkEquipmentTypeEnum(Enum):
+    GREY_TRANSCEIVERS_1G_SR = "1G SR (100m) MMF"
+    GREY_TRANSCEIVERS_10G_SR = "10G SR (100m) MMF"
+    GREY_TRANSCEIVERS_25G_SR = "25G SR (100m) MMF"
+    GREY_TRANSCEIVERS_50G_SR = "50G SR (100m) MMF"
+    GREY_TRANSCEIVERS_100G_SR = "100G SR (100m) MMF"
+    GREY_TRANSCEIVERS_400G_SR = "400G SR (100m) MMF"
+    GREY_TRANSCEIVERS_1G_LR = "1G LR/ER (30/40 km) SMF"
+    GREY_TRANSCEIVERS_10G_LR = "10G LR/ER (30/40 km) SMF"
+    GREY_TRANSCEIVERS_25G_LR = "25G LR/ER (30/40 km) SMF"
+    GREY_TRANSCEIVERS_50G_LR = "50G LR/ER (30/40 km) SMF"
+    GREY_TRANSCEIVERS_100G_LR = "100G LR/ER (30/40 km) SMF"
+    GREY_TRANSCEIVERS_400G_LR = "400G LR/ER (30/40 km) SMF"
+    WDM_TRANSCEIVERS_1G_LR = "WDM 1G LR/ER (30/40 km) SMF"
+    WDM_TRANSCEIVERS_10G_LR = "WDM 10G LR/ER (30/40 km) SMF"
+    WDM_TRANSCEIVERS_25G_LR = "WDM 25G LR/ER (30/40 km) SMF"
+    WDM_TRANSCEIVERS_50G_LR = "WDM 50G LR/ER (30/40 km) SMF"
+    WDM_TRANSCEIVERS_100G_LR = "WDM 100G LR/ER (30/40 km) SMF"
+    WDM_TRANSCEIVERS_400G_LR = "WDM 400G LR/ER (30/40 km) SMF"
+    CWDM_MUX = "CWDM multiplexer/demultiplexer"
+    WDM_MUX = "WDM multiplexer/demultiplexer"
+    SPLITTER_1_2 = "Splitter/combiner 1:2"
+    SPLITTER_1_4 = "Splitter/combiner 1:4"
+    SWITCH_SMALL = "small (2x200G)"
+    SWITCH_MEDIUM = "medium (2x800G)"
+    SWITCH_BIG = "Large (2x1.6T)"
+    SWITCH_EXTRA_LARGE = "Extra Large (2x3.2T)"
+    XR_MODULE_25G = "XR 25 G module"
+    XR_MODULE_50G = "XR 50 G module"
+    XR_MODULE_100G = "XR 100 G module"
+    XR_MODULE_200G = "XR 200 G module"
+    XR_MODULE_400G = "XR 400G module"
+    XR_MODULE_HUB_100G = "XR 100 G HUB module"
+    XR_MODULE_HUB_200G = "XR 200 G HUB module"
+    XR_MODULE_HUB_400G = "XR 400G HUB module"
+    MEDIA_CONVERTER_100G_4X25G = "Media Converter 100G (4x25G grey  -> 100G XR, 2x50G grey -> 100G XR, 100G grey -> 100G XR)"
+    MEDIA_CONVERTER_200G_8X25G = "Media Converter 200G (8x25G grey  -> 200G XR, 4x50G grey  -> 200G XR, 2x100G grey -> 200G XR)"
+    MEDIA_CONVERTER_400G_400G = "Media Converter 400G (400G XR -> 400G grey)"
+    TRANSPONDER = "Transponder"
+
+
+# Definition of the NetworkEquipmentType class
+class NetworkEquipmentType:
+    def __init__(self, name, data_rate, reach, price, normalized_price, max_power, typical_ff, insertion_loss=None,
+                 size=None, note=None, capacity=None, num_ports=None):
+        self.name = name
+        self.data_rate = data_rate
+        self.reach = reach
+        self.price = price
+        self.normalized_price = normalized_price
+        self.max_power = max_power
+        self.typical_ff = typical_ff
+        self.insertion_loss = insertion_loss
+        self.size = size
+        self.note = note
+        self.capacity = capacity  # Adding capacity attribute
+        self.num_ports = num_ports  # Added the new num_ports attribute
+        self.reach_m = parse_reach(reach)
+
+
+def parse_reach(reach):
+    """
+    Reach in metres from the catalog description ("100m MMF" -> 100, "30/40 km SMF" -> 40000,
+    taking the longest of the variants), None when the entry has no reach (mux, switch, ...).
+    """
+    match = re.search(r'(\d+(?:\.\d+)?(?:/\d+(?:\.\d+)?)*)\s*(km|m)\b', reach or '')
+    if match is None:
+        return None
+    longest = max(float(value) for value in match.group(1).split('/'))
+    return longest * (1000 if match.group(2) == 'km' else 1)
+
+
+# Global definition of network equipment types
+network_equipment_types = {
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_1G_SR: NetworkEquipmentType("1G SR (100m) MMF", 1, "100m MMF", 10.0,
+                                                                           0.00, 1, "SFP"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_10G_SR: NetworkEquipmentType("10G SR (100m) MMF", 10, "100m MMF", 20.0,
+                                                                            0.00, 1, "SFP+"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR: NetworkEquipmentType("25G SR (100m) MMF", 25, "100m MMF", 40.0,
+                                                                            0.01, 1, "SFP28"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_SR: NetworkEquipmentType("50G SR (100m) MMF", 50, "100m MMF", 270.0,
+                                                                            0.05, 1.5, "SFP56"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_SR: NetworkEquipmentType("100G SR (100m) MMF", 100, "100m MMF",
+                                                                             100.0, 0.02, 2.5, "QSFP28"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_SR: NetworkEquipmentType("400G SR (100m) MMF", 400, "100m MMF",
+                                                                             400.0, 0.08, 10, "QSFP-DD"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_1G_LR: NetworkEquipmentType("1G LR/ER (30/40 km) SMF", 1, "30/40 km SMF",
+                                                                           50.0, 0.01, 1, "SFP"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_10G_LR: NetworkEquipmentType("10G LR/ER (30/40 km) SMF", 10,
+                                                                            "30/40 km SMF", 100.0, 0.02, 1, "SFP+"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_LR: NetworkEquipmentType("25G LR/ER (30/40 km) SMF", 25,
+                                                                            "30/40 km SMF", 400.0, 0.08, 1.5, "SFP28"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_LR: NetworkEquipmentType("50G LR/ER (30/40 km) SMF", 50,
+                                                                            "30/40 km SMF", 1000.0, 0.20, 4, "QSFP27"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR: NetworkEquipmentType("100G LR/ER (30/40 km) SMF", 100,
+                                                                             "30/40 km SMF", 1500.0, 0.30, 4.5,
+                                                                             "QSFP28"),
+    NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_LR: NetworkEquipmentType("400G LR/ER (30/40 km) SMF", 400,
+                                                                             "30/40 km SMF", 5000.0, 1.00, 10,
+                                                                             "QSFP-DD"),
+    NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_1G_LR: NetworkEquipmentType("WDM 1G LR/ER (30/40 km) SMF", 1,
+                                                                          "30/40 km SMF", 100.0, 0.02, 1, "SFP+"),
+    NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_10G_LR: NetworkEquipmentType("WDM 10G LR/ER (30/40 km) SMF", 10,
+                                                                           "30/40 km SMF", 250.0, 0.05, 1.6, "SFP+"),
+    NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_25G_LR: NetworkEquipmentType("WDM 25G LR/ER (30/40 km) SMF", 25,
+                                                                           "30/40 km SMF", 800.0, 0.16, 2, "SFP28"),
+    NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_50G_LR: NetworkEquipmentType("WDM 50G LR/ER (30/40 km) SMF", 50,
+                                                                           "30/40 km SMF", 1800.0, 0.36, 4.5, "QSFP28"),
+    NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_100G_LR: NetworkEquipmentType("WDM 100G LR/ER (30/40 km) SMF", 100,
+                                                                            "30/40 km SMF", 2500.0, 0.50, 4.5,
+                                                                            "QSFP28"),
+    NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_400G_LR: NetworkEquipmentType("WDM 400G LR/ER (30/40 km) SMF", 400,
+                                                                            "30/40 km SMF", 9000.0, 1.80, 10,
+                                                                            "QSFP-DD"),
+    NetworkEquipmentTypeEnum.CWDM_MUX: NetworkEquipmentType("CWDM multiplexer/demultiplexer", None, "8 channels", 800.0,
+                                                            0.16, 1, 5.5),
+    NetworkEquipmentTypeEnum.WDM_MUX: NetworkEquipmentType("WDM multiplexer/demultiplexer", None, "40 channels", 1200.0,
+                                                           0.24, 1, 3.2),
+    NetworkEquipmentTypeEnum.SPLITTER_1_2: NetworkEquipmentType("Splitter/combiner 1:2", None, "1:2", 100.0, 0.02, 0,
+                                                                3.5),
+    NetworkEquipmentTypeEnum.SPLITTER_1_4: NetworkEquipmentType("Splitter/combiner 1:4", None, "1:4", 100.0, 0.02, 0,
+                                                                7.0),
+    NetworkEquipmentTypeEnum.SWITCH_SMALL: NetworkEquipmentType("small (2x200G)", None, "", 3000.0, 0.60*4, 100, "", None,
+                                                                "small", 250, 400),
+    NetworkEquipmentTypeEnum.SWITCH_MEDIUM: NetworkEquipmentType("medium (2x800G)", None, "", 8000.0, 1.60*4, 300, "",
+                                                                 None, "medium", 350, 1600),
+    NetworkEquipmentTypeEnum.SWITCH_BIG: NetworkEquipmentType("Large (2x1.6T)", None, "", 14000.0, 2.80*4, 460, "", None,
+                                                              "large", 460, 3200),
+    NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE: NetworkEquipmentType("Extra Large (2x3.2T)", None, "", 14001.0, 4.0*4.0,
+                                                                      620, "", None, "extra_large", 620, 6400),
+    NetworkEquipmentTypeEnum.XR_MODULE_25G: NetworkEquipmentType("XR 25 G module", 100,
+                                                                 "coherent DSCM ≈ 200 km reach", 1000.0, 0.10, 3.5,
+                                                                 "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_50G: NetworkEquipmentType("XR 50 G module", 100,
+                                                                 "coherent DSCM ≈ 200 km reach", 2000.0, 0.16, 3.5,
+                                                                 "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_100G: NetworkEquipmentType("XR 100 G module", 100,
+                                                                  "coherent DSCM ≈ 200 km reach", 3000.0, 0.26, 3.5,
+                                                                  "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_200G: NetworkEquipmentType("XR 200 G module", 200,
+                                                                  "coherent DSCM ≈ 200 km reach", 5000.0, 0.42, 42, 4.5,
+                                                                  "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_400G: NetworkEquipmentType("XR 400G module", 400, "coherent DSCM ≈ 200 km reach",
+                                                                  9000.0, 0.76, 8, "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G: NetworkEquipmentType("XR 100 G HUB module", 100,
+                                                                      "coherent DSCM ≈ 200 km reach", 3000.0, 0.28, 3.5,
+                                                                      "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_HUB_200G: NetworkEquipmentType("XR 200 G HUB module", 200,
+                                                                      "coherent DSCM ≈ 200 km reach", 5000.0, 0.50, 4.5,
+                                                                      "pluggable"),
+    NetworkEquipmentTypeEnum.XR_MODULE_HUB_400G: NetworkEquipmentType("XR 400G HUB module", 400,
+                                                                      "coherent DSCM ≈ 200 km reach",
+                                                                      9000.0, 0.84, 8, "pluggable"),
+    NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G: NetworkEquipmentType(
+        "Media Converter 100G (4x25G grey  -> 100G XR, 2x50G grey -> 100G XR, 100G grey -> 100G XR)", 100,
+        "for client-XR module adaptation", 2000.0, 0.30, 2, ""),
+    NetworkEquipmentTypeEnum.MEDIA_CONVERTER_200G_8X25G: NetworkEquipmentType(
+        "Media Converter 200G (8x25G grey  -> 200G XR, 4x50G grey  -> 200G XR, 2x100G grey -> 200G XR)", 200,
+        "for client-XR module adaptation", 3000.0, 0.40, 3, ""),
+    NetworkEquipmentTypeEnum.MEDIA_CONVERTER_400G_400G: NetworkEquipmentType(
+        "Media Converter 400G (400G XR -> 400G grey)", 400,
+        "Usually it should not be necessary XR should be plugged directly in CO router", 5000.0, 0.50, 5, ""),
+    NetworkEquipmentTypeEnum.TRANSPONDER: NetworkEquipmentType("Transponder", None, None, 4500.0, 0.90, 0, None, None,
+                                                               None, 4.33, num_ports=5)  # Added the number of ports
+}
+
+# ============================================
+# SALVATAGGIO E RIPRISTINO COSTI ORIGINALI
+# ============================================
+
+# Salva TUTTI i costi originali all'inizio del programma
+ORIGINAL_ALL_COSTS = {}
+
+def save_all_original_costs():
+    """Salva tutti i costi originali di network equipment"""
+    global ORIGINAL_ALL_COSTS
+    for eq_enum in NetworkEquipmentTypeEnum:
+        ORIGINAL_ALL_COSTS[eq_enum] = {
+            'price': network_equipment_types[eq_enum].price,
+            'normalized_price': network_equipment_types[eq_enum].normalized_price,
+            'max_power': network_equipment_types[eq_enum].max_power
+        }
+
+def reset_all_costs_to_original():
+    """Ripristina tutti i costi ai valori originali"""
+    for eq_enum, original_values in ORIGINAL_ALL_COSTS.items():
+        network_equipment_types[eq_enum].price = original_values['price']
+        network_equipment_types[eq_enum].normalized_price = original_values['normalized_price']
+        network_equipment_types[eq_enum].max_power = original_values['max_power']
+
+
+# CHIAMA QUESTA FUNZIONE SUBITO DOPO LE DEFINIZIONI DI network_equipment_types
+# Mettila subito dopo la riga: network_equipment_types = { ... }
+save_all_original_costs()
+
+# Updated NetworkEquipment class
+class NetworkEquipment:
+    def __init__(self, equipment_type_enum, quantity=1):
+        spec = network_equipment_types[equipment_type_enum]
+        self.equipment_type = equipment_type_enum
+        self.quantity = quantity  # Unità rappresentate da questa voce
+        self.data_rate = spec.data_rate
+        self.reach = spec.reach
+        self.price = spec.price
+        self.normalized_price = spec.normalized_price
+        self.max_power = spec.max_power
+        self.typical_ff = spec.typical_ff
+        self.insertion_loss = spec.insertion_loss
+        self.size = spec.size
+        self.note = spec.note
+        self.capacity = spec.capacity
+
+
+# Classi di apparati: una voce appartiene al primo prefisso con cui inizia il nome
+EQUIPMENT_CLASSES = ('GREY_TRANSCEIVERS', 'WDM_TRANSCEIVERS', 'XR_MODULE', 'MEDIA_CONVERTER',
+                     'TRANSPONDER', 'CWDM_MUX', 'WDM_MUX', 'SPLITTER', 'SWITCH')
+
+
+def equipment_class(name, classes=EQUIPMENT_CLASSES):
+    for prefix in classes:
+        if name.startswith(prefix):
+            return prefix
+    return name
+
+
+class EquipmentCounters:
+    """
+    Running totals of the network equipment installed on a node, updated on every insertion
+    so that sizing the root does not rescan its equipment list.
+    """
+
+    def __init__(self):
+        self.capacity = 0  # Somma dei data_rate, come la sommava add_switches_to_root
+        self.capacity_by_class = {}
+        self.wdm_transceivers = 0
+        self.xr_capacity = 0
+
+    def add(self, eq_enum, count=1):
+        data_rate = network_equipment_types[eq_enum].data_rate
+        if data_rate is not None:
+            self.capacity += data_rate * count
+            eq_class = equipment_class(eq_enum.name)
+            self.capacity_by_class[eq_class] = self.capacity_by_class.get(eq_class, 0) + data_rate * count
+            if eq_class == 'XR_MODULE':
+                self.xr_capacity += data_rate * count
+        if 'WDM_TRANSCEIVERS' in eq_enum.name:
+            self.wdm_transceivers += count
+
+    def merge(self, other):
+        self.capacity += other.capacity
+        for eq_class, capacity in other.capacity_by_class.items():
+            self.capacity_by_class[eq_class] = self.capacity_by_class.get(eq_class, 0) + capacity
+        self.wdm_transceivers += other.wdm_transceivers
+        self.xr_capacity += other.xr_capacity
+
+    @classmethod
+    def of(cls, eq_enums):
+        counters = cls()
+        for eq_enum in eq_enums:
+            counters.add(eq_enum)
+        return counters
+
+
+def node_counters(T, node):
+    """EquipmentCounters of a node, built from its equipment list the first time they are needed"""
+    attributes = T.nodes[node]
+    if 'equipment_counters' not in attributes:
+        counters = EquipmentCounters()
+        for equipment in attributes.get('network_equipment', []):
+            counters.add(equipment.equipment_type, equipment.quantity)
+        attributes['equipment_counters'] = counters
+    return attributes['equipment_counters']
+
+
+def add_network_equipment(T, node, eq_enum, count=1):
+    """Install ``count`` units of a catalog entry on a node, as one counted entry, and update its counters"""
+    if count:
+        T.nodes[node]['network_equipment'].append(NetworkEquipment(eq_enum, count))
+        node_counters(T, node).add(eq_enum, count)
+
+
+class Fiber:
+    def __init__(self, num_wavelengths=10):
+        self.wavelengths = {f'wavelength_{i}': np.random.randint(0, 81) for i in range(num_wavelengths)}
+
+
+def create_mst(numNodes=50, squareSize=200):
+    halfSize = squareSize / 2
+
+    # Generation of random points
+    points = -halfSize + squareSize * np.random.rand(numNodes, 2)
+    points[0, :] = [0, 0]  # The root of the tree is fixed at (0,0)
+
+    # Creation of the Manhattan distance matrix
+    distances = np.zeros((numNodes, numNodes))
+    for i in range(numNodes):
+        for j in range(numNodes):
+            distances[i, j] = np.sum(np.abs(points[i, :] - points[j, :]))
+
+    # Creation of the graph with Manhattan distances
+    G = nx.Graph()
+    for i in range(numNodes):
+        for j in range(i + 1, numNodes):
+            G.add_edge(i, j, weight=distances[i, j])
+
+    # Compute the minimum spanning tree using Prim's algorithm
+    T = nx.minimum_spanning_tree(G, weight='weight', algorithm='prim')
+
+    return T, points
+
+
+def add_node_types(T, points):
+    numNodes = len(T.nodes())
+    types = np.random.randint(1, 3, numNodes)
+    types[0] = 0  # The node at the origin is of type 0
+
+    for node in T.nodes():
+        T.nodes[node]['type'] = types[node]
+        T.nodes[node]['position'] = points[node]
+        T.nodes[node]['id'] = node  # Add node ID
+
+    return T, types
+
+
+def add_properties(T):
+    for node in T.nodes():
+        network_equipment = []
+        for eq_enum in NetworkEquipmentTypeEnum:
+            equipment = NetworkEquipment(eq_enum)
+            network_equipment.append(equipment)
+
+        radio_equipment = []
+        for eq_enum in RadioEquipmentTypeEnum:
+            equipment = RadioEquipment(eq_enum)
+            radio_equipment.append(equipment)
+
+        T.nodes[node]['radio_equipment'] = radio_equipment
+        T.nodes[node]['network_equipment'] = network_equipment
+        T.nodes[node]['equipment_counters'] = EquipmentCounters.of(NetworkEquipmentTypeEnum)
+
+    for u, v in T.edges():
+        fibers = [Fiber() for _ in range(np.random.randint(1, 5))]
+        T.edges[u, v]['fibers'] = fibers
+        T.edges[u, v]['distance'] = T.edges[u, v]['weight']
+
+    return T
+
+
+def add_specific_network_equipment(T, node, equipment_type_enum):
+    # Add a specific network equipment to the node based on the enum type
+    if 'network_equipment' not in T.nodes[node]:
+        T.nodes[node]['network_equipment'] = []
+    add_network_equipment(T, node, equipment_type_enum)
+
+
+# Function to add a specific radio equipment
+def add_specific_radio_equipment(T, node, equipment_type_enum):
+    specific_equipment = RadioEquipment(equipment_type_enum)
+    if 'radio_equipment' not in T.nodes[node]:
+        T.nodes[node]['radio_equipment'] = []
+    T.nodes[node]['radio_equipment'].append(specific_equipment)
+
+
+# Radio equipment deployed per node type, for each scenario [Dense Urban, Urban, Suburban, Rural]
+# and term [Medium, Long]; macro sites have 3 sectors (quantities × 3)
+RADIO_DEPLOYMENT_TABLE = {
+    1: [
+        (RadioEquipmentTypeEnum.MACRO_SUB_GHZ, [[2, 2], [2, 3], [2, 4], [1, 3]]),
+        (RadioEquipmentTypeEnum.MACRO_1_3_GHZ, [[3, 4], [2, 4], [2, 3], [1, 2]]),
+        (RadioEquipmentTypeEnum.MACRO_3_7_GHZ, [[2, 2], [1, 2], [1, 2], [1, 1]]),
+        (RadioEquipmentTypeEnum.MACRO_24_46_GHZ, [[0, 0], [0, 0], [1, 1], [1, 1]])
+    ],
+    2: [
+        (RadioEquipmentTypeEnum.SMALL_3_7_GHZ, [[2, 3], [1, 2], [0, 1], [0, 0]]),
+        (RadioEquipmentTypeEnum.SMALL_7_15_GHZ, [[0, 1], [0, 1], [0, 0], [0, 0]]),
+        (RadioEquipmentTypeEnum.SMALL_24_46_GHZ, [[1, 2], [1, 1], [0, 1], [0, 0]])
+    ]
+}
+RADIO_SECTORS = {1: 3, 2: 1}
+
+RADIO_SCENARIOS = ["Dense Urban", "Urban", "Suburban", "Rural"]
+RADIO_TERMS = ['Medium', 'Long']
+RADIO_TYPES = list(RadioEquipmentTypeEnum)
+
+
+def compile_radio_deployment(table=RADIO_DEPLOYMENT_TABLE, sectors=RADIO_SECTORS):
+    """
+    Compile the deployment table into a count array [node type, scenario, term, radio type].
+    Node types not in the table (root) get no radio equipment.
+    """
+    deployment = np.zeros((max(table) + 1, len(RADIO_SCENARIOS), len(RADIO_TERMS), len(RADIO_TYPES)), dtype=int)
+    for node_type, entries in table.items():
+        for eq_enum, quantities in entries:
+            deployment[node_type, :, :, RADIO_TYPES.index(eq_enum)] = np.array(quantities) * sectors[node_type]
+    return deployment
+
+
+def compile_radio_capacity():
+    """Required capacity (Gbps) of one unit of each radio type, array [term, radio type]"""
+    return np.array([[RadioEquipment(eq_enum).calculate_required_capacity(term) for eq_enum in RADIO_TYPES]
+                     for term in RADIO_TERMS])
+
+
+RADIO_DEPLOYMENT = compile_radio_deployment()
+RADIO_REQUIRED_CAPACITY = compile_radio_capacity()
+
+
+@lru_cache(maxsize=None)
+def radio_units(counts):
+    """
+    RadioEquipment units of a radio mix (tuple of counts per radio type), in deployment order.
+    Units are built once per distinct mix and shared by all the nodes with that mix
+    (they are never modified by the solutions).
+    """
+    return tuple(RadioEquipment(eq_enum) for eq_enum, count in zip(RADIO_TYPES, counts) for _ in range(count))
+
+
+def radio_counts_matrix(T, nodes=None):
+    """Radio count vectors of the nodes (all nodes by default) as an array [node, radio type]"""
+    nodes = list(T.nodes()) if nodes is None else nodes
+    return np.array([T.nodes[node].get('radio_counts', np.zeros(len(RADIO_TYPES), dtype=int)) for node in nodes],
+                    dtype=int).reshape(len(nodes), len(RADIO_TYPES))
+
+
+def node_radio_demand(T, term, nodes=None):
+    """Required capacity (Gbps) of every node as count matrix × per-unit capacity"""
+    return radio_counts_matrix(T, nodes) @ RADIO_REQUIRED_CAPACITY[RADIO_TERMS.index(term)]
+
+
+def total_radio_demand(T, term):
+    return float(node_radio_demand(T, term).sum())
+
+
+def _set_radio_counts(T, node, counts):
+    if 'radio_counts' in T.nodes[node]:
+        counts = T.nodes[node]['radio_counts'] + counts
+    T.nodes[node]['radio_counts'] = counts
+    T.nodes[node]['radio_equipment'] = list(radio_units(tuple(int(count) for count in counts)))
+
+
+def add_radio_equipment_based_on_scenario(T, node, term, scenario):
+    node_type = T.nodes[node]['type']
+    if 0 <= node_type < len(RADIO_DEPLOYMENT):
+        counts = RADIO_DEPLOYMENT[node_type, RADIO_SCENARIOS.index(scenario), RADIO_TERMS.index(term)]
+        _set_radio_counts(T, node, counts.copy())
+
+
+def deploy_radio_equipment(T, term, scenario):
+    """
+    Give every node its radio count vector for the scenario/term with a single lookup in
+    RADIO_DEPLOYMENT; 'radio_equipment' keeps the per-unit view used by the solutions.
+    """
+    nodes = list(T.nodes())
+    node_types = np.array([T.nodes[node]['type'] for node in nodes], dtype=int)
+    known = (node_types >= 0) & (node_types < len(RADIO_DEPLOYMENT))
+    counts = np.zeros((len(nodes), len(RADIO_TYPES)), dtype=int)
+    counts[known] = RADIO_DEPLOYMENT[node_types[known], RADIO_SCENARIOS.index(scenario), RADIO_TERMS.index(term)]
+
+    for node, node_counts, has_radio in zip(nodes, counts, known):
+        if has_radio:
+            _set_radio_counts(T, node, node_counts)
+
+
+def calculate_cost_component(T, component_types):
+    total_cost = 0.0
+    for node in T.nodes():
+        for equipment in T.nodes[node]['network_equipment']:
+            if any(comp_type in equipment.equipment_type.name for comp_type in component_types):
+                total_cost += network_equipment_types[equipment.equipment_type].normalized_price * equipment.quantity
+    return total_cost
+
+
+def initialize_node_equipment(T):
+    for node in T.nodes():
+        if 'radio_equipment' not in T.nodes[node]:
+            T.nodes[node]['radio_equipment'] = []
+        if 'network_equipment' not in T.nodes[node]:
+            T.nodes[node]['network_equipment'] = []
+        if 'other_consumption' not in T.nodes[node]:
+            T.nodes[node]['other_consumption'] = 0
+        if 'switching_consumption' not in T.nodes[node]:
+            T.nodes[node]['switching_consumption'] = 0
+        if 'switch_loads' not in T.nodes[node]:
+            T.nodes[node]['switch_loads'] = []
+        node_counters(T, node)
+
+
+def allocate_capacity_macro(T, path, total_required_capacity):
+    # Create a pair of fibers for the entire path and allocate the total capacity
+    for i in range(len(path) - 1):
+        u, v = path[i], path[i + 1]
+
+        if 'fibers' not in T.edges[u, v]:
+            T.edges[u, v]['fibers'] = []
+
+        # Create two new fibers for the entire path
+        T.edges[u, v]['fibers'].append(Fiber())
+        T.edges[u, v]['fibers'].append(Fiber())
+
+        fibers_to_use = T.edges[u, v]['fibers'][-2:]  # Use the last two added fibers
+
+        # Occupy one wavelength on each fiber
+        for fiber in fibers_to_use:
+            for wavelength, current_capacity in fiber.wavelengths.items():
+                if current_capacity == 0:
+                    fiber.wavelengths[wavelength] = total_required_capacity
+                    break  # Exit the loop after occupying the capacity
+
+
+def allocate_capacity_small(T, path, radio_equipment, term):
+    # Create a pair of fibers for each radio equipment and allocate the specific capacity
+    for radio_eq in radio_equipment:
+        required_capacity = radio_eq.calculate_required_capacity(term)
+
+        for i in range(len(path) - 1):
+            u, v = path[i], path[i + 1]
+
+            if 'fibers' not in T.edges[u, v]:
+                T.edges[u, v]['fibers'] = []
+
+            # Create two new fibers for each radio equipment
+            T.edges[u, v]['fibers'].append(Fiber())
+            T.edges[u, v]['fibers'].append(Fiber())
+
+            fibers_to_use = T.edges[u, v]['fibers'][-2:]  # Use the last two added fibers
+
+            # Occupy one wavelength on each fiber
+            for fiber in fibers_to_use:
+                for wavelength, current_capacity in fiber.wavelengths.items():
+                    if current_capacity == 0:
+                        fiber.wavelengths[wavelength] = required_capacity
+                        break  # Exit the loop after occupying the capacity
+
+
+# ============================================
+# DIMENSIONAMENTO PER NODO (MEMOIZZATO PER MIX RADIO)
+# ============================================
+
+class NodePlan:
+    """
+    Equipment placed by a solution for one node, as a pure function of (node type, radio mix, term).
+
+    :param node_equipment: Equipment types installed at the node (switches included)
+    :param root_equipment: Equipment types installed at the root on behalf of the node
+    :param switches: (switch type, load) of the switches installed at the node
+    :param allocations: (allocation function, extra args) run on the node -> root path
+    :param root_capacity: Capacity the root has to terminate for the node (P2MP hub sizing)
+    """
+
+    def __init__(self, node_equipment=(), root_equipment=(), switches=(), allocations=(), root_capacity=0):
+        self.node_equipment = tuple(node_equipment)
+        self.root_equipment = tuple(root_equipment)
+        self.switches = tuple(switches)
+        self.allocations = tuple(allocations)
+        self.root_capacity = root_capacity
+
+        # Apparati che contribuiscono a other_consumption (gli switch sono in switching_consumption)
+        self.node_power = _count_equipment(eq_enum for eq_enum in self.node_equipment if eq_enum not in SWITCH_TYPES)
+        self.root_power = _count_equipment(self.root_equipment)
+        self.node_counters = EquipmentCounters.of(self.node_equipment)
+        self.root_counters = EquipmentCounters.of(self.root_equipment)
+
+
+SWITCH_TYPES = (NetworkEquipmentTypeEnum.SWITCH_SMALL, NetworkEquipmentTypeEnum.SWITCH_MEDIUM,
+                NetworkEquipmentTypeEnum.SWITCH_BIG, NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE)
+
+
+def _count_equipment(equipment):
+    counts = {}
+    for eq_enum in equipment:
+        counts[eq_enum] = counts.get(eq_enum, 0) + 1
+    return tuple(counts.items())
+
+
+# Nodi di solo transito (gli angoli Manhattan di T_m): nessun apparato, solo fibra
+PASS_THROUGH_TYPES = (4,)
+
+
+def dimensioned_nodes(T, root_node=0):
+    """Nodes that get equipment: all but the root and the pass-through (corner) nodes"""
+    return [node for node in T.nodes() if node != root_node and T.nodes[node]['type'] not in PASS_THROUGH_TYPES]
+
+
+def root_routes(T, root_node=0):
+    """
+    Distance ('weight') and node -> root path of every node, from a single Dijkstra cached in
+    T.graph. Copies of the graph made after the first call share the cache, so the routes of a
+    topology are computed once for all the solutions dimensioned on it.
+
+    :return: (dict node -> distance, dict node -> path from the node to the root)
+    """
+    cache = T.graph.setdefault('root_routes', {})
+    if root_node not in cache:
+        distances, paths = nx.single_source_dijkstra(T, root_node, weight='weight')
+        cache[root_node] = (distances, {node: path[::-1] for node, path in paths.items()})
+    return cache[root_node]
+
+
+def radio_mix(T, node):
+    """Radio count vector of a node as a hashable tuple (from 'radio_counts' or the radio units)"""
+    if 'radio_counts' in T.nodes[node]:
+        return tuple(int(count) for count in T.nodes[node]['radio_counts'])
+    deployed = [eq.equipment_type for eq in T.nodes[node].get('radio_equipment', [])]
+    return tuple(deployed.count(eq_enum) for eq_enum in RADIO_TYPES)
+
+
+@lru_cache(maxsize=4096)
+def dimension_node(dimension_fn, node_type, mix, term, reach=None):
+    """
+    Memoized per-node dimensioning: every distinct (solution, node type, radio mix, term, reach
+    class) is dimensioned once; all the nodes sharing it reuse the same NodePlan.
+    """
+    return dimension_fn(node_type, radio_units(mix), term, reach)
+
+
+def node_reach(T, node, root_node=0):
+    """Reach class (see reach_class) of the node -> root path, from the cached root distances"""
+    return reach_class(root_routes(T, root_node)[0][node])
+
+
+def equipment_power(counts):
+    # Potenza dal catalogo corrente (anche con max_power "taggate" dalla sensitivity)
+    return sum(network_equipment_types[eq_enum].max_power * count for eq_enum, count in counts)
+
+
+def install_node_plan(T, node, plan, root_node=0):
+    """Install the equipment, power and switches of a NodePlan on the node (and its share on the root)"""
+    T.nodes[node]['network_equipment'].extend(NetworkEquipment(eq_enum) for eq_enum in plan.node_equipment)
+    T.nodes[root_node]['network_equipment'].extend(NetworkEquipment(eq_enum) for eq_enum in plan.root_equipment)
+    node_counters(T, node).merge(plan.node_counters)
+    node_counters(T, root_node).merge(plan.root_counters)
+    T.nodes[node]['other_consumption'] += equipment_power(plan.node_power)
+    T.nodes[root_node]['other_consumption'] += equipment_power(plan.root_power)
+
+    for switch_type, load in plan.switches:
+        add_switch_consumption(T, node, switch_type, load)
+
+
+def apply_node_plan(T, node, plan, root_node=0):
+    """Install a NodePlan on the node (and its share on the root) and allocate its path capacity"""
+    install_node_plan(T, node, plan, root_node)
+
+    if plan.allocations:
+        path = root_routes(T, root_node)[1][node]
+        for allocate_fn, args in plan.allocations:
+            allocate_fn(T, path, *args)
+
+
+# Map/reduce del dimensionamento: nodi per task e soglia oltre la quale il map va su più processi
+DIMENSIONING_CHUNK_SIZE = 1000
+PARALLEL_DIMENSIONING_MIN_NODES = 5000
+DIMENSIONING_WORKERS = None  # None = os.cpu_count()
+
+# Policy di WavelengthAssigner con cui assegnare le lunghezze d'onda su fibre condivise
+# ('first_fit', 'most_used'); None = due fibre nuove per ogni allocazione, come nelle versioni precedenti
+WAVELENGTH_ASSIGNMENT = None
+
+# FiberPacking con cui riempire pool di fibre contati per link invece di creare oggetti Fiber
+FIBER_PACKING = None
+
+_dimensioning_graph = None
+
+
+def _set_dimensioning_graph(T):
+    global _dimensioning_graph
+    _dimensioning_graph = T
+
+
+def _dimension_chunk(dimension_fn, term, root_node, chunk, allocate=True, seed=None):
+    """
+    Map task: dimension a chunk of (node, node type, radio mix, reach) and allocate each node's fibers
+    on a scratch copy of its node -> root path. The allocations only ever fill the fibers they
+    create, so the fibers of different nodes are independent and can be merged afterwards.
+
+    :param allocate: False to leave the fibers to the reduce (shared-fiber wavelength assignment)
+    :param seed: Seed of np.random for the occupancy drawn by the new Fiber objects of the chunk
+                 (the caller's random state is restored afterwards)
+    :return: List of (node, node type, mix, reach, [(u, v, new fibers)]) in chunk order
+    """
+    T = _dimensioning_graph
+    paths = root_routes(T, root_node)[1]
+    state = np.random.get_state()
+    if seed is not None:
+        np.random.seed(seed)
+    results = []
+    try:
+        for node, node_type, mix, reach in chunk:
+            plan = dimension_node(dimension_fn, node_type, mix, term, reach)
+            fibers = []
+            if allocate and plan.allocations:
+                path = paths[node]
+                scratch = nx.Graph()
+                nx.add_path(scratch, path)
+                for allocate_fn, args in plan.allocations:
+                    allocate_fn(scratch, path, *args)
+                fibers = [(u, v, scratch.edges[u, v].get('fibers', [])) for u, v in zip(path, path[1:])]
+            results.append((node, node_type, mix, reach, fibers))
+    finally:
+        if seed is not None:
+            np.random.set_state(state)
+    return results
+
+
+def _map_dimension_chunks(T, dimension_fn, term, root_node, chunks, max_workers=None, allocate=True):
+    # Un seed per chunk, estratto dallo stato di np.random del chiamante: le occupazioni casuali
+    # delle fibre sono le stesse in serie e con il pool, e lo stato del chiamante avanza
+    seeds = list(np.random.randint(0, 2 ** 31 - 1, size=len(chunks))) if allocate else [None] * len(chunks)
+
+    # Pool solo per grafi grandi e con fork (i worker ereditano T senza serializzarlo)
+    parallel = (sum(len(chunk) for chunk in chunks) >= PARALLEL_DIMENSIONING_MIN_NODES and len(chunks) > 1
+                and 'fork' in multiprocessing.get_all_start_methods())
+    if not parallel:
+        _set_dimensioning_graph(T)
+        try:
+            return [_dimension_chunk(dimension_fn, term, root_node, chunk, allocate, seed)
+                    for chunk, seed in zip(chunks, seeds)]
+        finally:
+            _set_dimensioning_graph(None)
+
+    n = len(chunks)
+    with ProcessPoolExecutor(max_workers=max_workers or DIMENSIONING_WORKERS,
+                             mp_context=multiprocessing.get_context('fork'),
+                             initializer=_set_dimensioning_graph, initargs=(T,)) as pool:
+        return list(pool.map(_dimension_chunk, [dimension_fn] * n, [term] * n, [root_node] * n, chunks,
+                             [allocate] * n, seeds))
+
+
+def dimension_nodes(T, dimension_fn, term, root_node=0, max_workers=None, wavelength_assignment=None,
+                    fiber_packing=None):
+    """
+    Dimension and install every non-root node, returns the plans by node.
+
+    Map: the nodes are split in chunks of DIMENSIONING_CHUNK_SIZE, each dimensioned with its
+    path fibers allocated independently (in a worker pool for large graphs). The random
+    wavelength occupancy of the new fibers is drawn from a per-chunk seed taken from np.random,
+    so it is the same whether the chunks run serially or in the pool.
+    Reduce: plans and fibers are installed on T in node order; the root equipment is then
+    sized by the solution from the summed plans.
+
+    With a wavelength assignment policy (default WAVELENGTH_ASSIGNMENT) the lightpaths of every
+    node are instead placed in the reduce, in node order, by one WavelengthAssigner that reuses
+    the fibers already on the path and adds fibers only where no wavelength is left.
+    With a FiberPacking (default FIBER_PACKING) they are added to the counted fiber pool of
+    every link of the path instead.
+    """
+    policy = wavelength_assignment or WAVELENGTH_ASSIGNMENT
+    packing = fiber_packing or FIBER_PACKING
+    if policy is not None and packing is not None:
+        raise ValueError("Choose either a wavelength assignment policy or a fiber packing, not both")
+    nodes = [(node, T.nodes[node]['type'], radio_mix(T, node), node_reach(T, node, root_node))
+             for node in dimensioned_nodes(T, root_node)]
+    chunks = [nodes[i:i + DIMENSIONING_CHUNK_SIZE] for i in range(0, len(nodes), DIMENSIONING_CHUNK_SIZE)]
+
+    # Percorsi calcolati prima del map, così i worker li ereditano con il grafo
+    paths = root_routes(T, root_node)[1]
+    assigner = WavelengthAssigner(T, policy=policy) if policy is not None else None
+    shared_fibers = assigner is not None or packing is not None
+
+    plans = {}
+    for chunk_result in _map_dimension_chunks(T, dimension_fn, term, root_node, chunks, max_workers,
+                                              allocate=not shared_fibers):
+        for node, node_type, mix, reach, fibers in chunk_result:
+            plan = dimension_node(dimension_fn, node_type, mix, term, reach)
+            install_node_plan(T, node, plan, root_node)
+            for u, v, edge_fibers in fibers:
+                T.edges[u, v].setdefault('fibers', []).extend(edge_fibers)
+            if shared_fibers:
+                path = paths[node]
+                for allocate_fn, args in plan.allocations:
+                    if assigner is not None:
+                        assigner.assign_all(path, lightpath_capacities(allocate_fn, args))
+                    else:
+                        packing.allocate(T, path, lightpath_capacities(allocate_fn, args))
+            plans[node] = plan
+    return plans
+
+
+def lightpath_capacities(allocate_fn, args):
+    """Capacities of the lightpaths (one wavelength each) placed by an allocation of a NodePlan"""
+    if allocate_fn in (allocate_capacity_macro, allocate_capacity_xr_on_path_macro):
+        return list(args[:1])
+    radio_equipment, term = args[:2]
+    return [radio_eq.calculate_required_capacity(term) for radio_eq in radio_equipment]
+
+
+def node_mix_multiplicity(T, root_node=0):
+    """Distinct (node type, radio mix, reach class) of the dimensioned nodes with their multiplicity"""
+    multiplicity = {}
+    for node in dimensioned_nodes(T, root_node):
+        key = (T.nodes[node]['type'], radio_mix(T, node), node_reach(T, node, root_node))
+        multiplicity[key] = multiplicity.get(key, 0) + 1
+    return multiplicity
+
+
+def node_level_bom(T, dimension_fn, term, root_node=0):
+    """
+    Bill of materials installed by the per-node step of a solution (node and root side, root-level
+    sizing excluded) without touching the graph: one NodePlan per distinct mix × its multiplicity.
+    """
+    bom = {}
+    for (node_type, mix, reach), count in node_mix_multiplicity(T, root_node).items():
+        plan = dimension_node(dimension_fn, node_type, mix, term, reach)
+        for eq_enum in plan.node_equipment + plan.root_equipment:
+            bom[eq_enum] = bom.get(eq_enum, 0) + count
+    return bom
+
+
+def _switch_for_capacity(capacity):
+    if capacity <= 400:
+        return NetworkEquipmentTypeEnum.SWITCH_SMALL
+    elif capacity <= 1600:
+        return NetworkEquipmentTypeEnum.SWITCH_MEDIUM
+    elif capacity <= 3200:
+        return NetworkEquipmentTypeEnum.SWITCH_BIG
+    else:
+        return NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE
+
+
+# Reach distinte del catalogo: i nodi con la stessa classe di reach condividono il NodePlan
+REACH_CLASSES = sorted({spec.reach_m for spec in network_equipment_types.values() if spec.reach_m is not None})
+
+
+def reach_class(distance):
+    """Shortest catalog reach covering ``distance`` (m), inf beyond every optic"""
+    index = bisect_left(REACH_CLASSES, distance)
+    return REACH_CLASSES[index] if index < len(REACH_CLASSES) else float('inf')
+
+
+GREY_LR_OPTICS = [NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_1G_LR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_10G_LR,
+                  NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_LR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_LR,
+                  NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_LR]
+GREY_SR_OPTICS = [NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_1G_SR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_10G_SR,
+                  NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_SR,
+                  NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_SR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_SR]
+# Ottiche grey candidate per il link verso la root: le SR bastano sui percorsi entro 100 m
+# (le revisioni v9 - v11 usano solo le LR, come gli script originali)
+GREY_UPLINK_OPTICS = tuple(GREY_SR_OPTICS + GREY_LR_OPTICS)
+WDM_LR_OPTICS = [NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_1G_LR, NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_10G_LR,
+                 NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_25G_LR, NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_50G_LR,
+                 NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_100G_LR, NetworkEquipmentTypeEnum.WDM_TRANSCEIVERS_400G_LR]
+
+
+def optic_for(optics, capacity, reach=None):
+    """
+    Cheapest optic among ``optics`` whose data rate covers ``capacity`` and whose reach covers
+    ``reach`` (m); when none is fast enough, the cheapest of the fastest ones in reach. Prices
+    are the original catalog ones (ORIGINAL_ALL_COSTS), so the choice does not follow the price
+    scenarios and the NodePlans stay price-independent.
+
+    When no optic reaches that far, or the reach is unknown (None), only the longest-reach
+    optics are candidates.
+    """
+    reaches = {eq_enum: network_equipment_types[eq_enum].reach_m for eq_enum in optics}
+    in_reach = [eq_enum for eq_enum in optics
+                if reach is not None and (reaches[eq_enum] is None or reaches[eq_enum] >= reach)]
+    if not in_reach:
+        longest = max(reaches.values())
+        in_reach = [eq_enum for eq_enum in optics if reaches[eq_enum] == longest]
+
+    rates = {eq_enum: network_equipment_types[eq_enum].data_rate for eq_enum in in_reach}
+    adequate = [eq_enum for eq_enum in in_reach if capacity <= rates[eq_enum]]
+    if not adequate:
+        fastest = max(rates.values())
+        adequate = [eq_enum for eq_enum in in_reach if rates[eq_enum] == fastest]
+    # A parità di prezzo la più lenta, poi l'ordine della lista
+    return min(adequate, key=lambda eq_enum: (ORIGINAL_ALL_COSTS[eq_enum]['normalized_price'], rates[eq_enum]))
+
+
+def _grey_sr_for(capacity):
+    if capacity <= 1:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_1G_SR
+    elif capacity <= 10:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_10G_SR
+    elif capacity <= 25:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR
+    elif capacity <= 50:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_SR
+    elif capacity <= 100:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_SR
+    else:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_SR
+
+
+def _wdm_lr_for(capacity, reach=None):
+    return optic_for(WDM_LR_OPTICS, capacity, reach)
+
+
+def _p2mp_sr_for(capacity):
+    # Le soluzioni P2MP usano SR da almeno 25G
+    if capacity <= 25:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR
+    elif capacity <= 50:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_SR
+    elif capacity <= 100:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_SR
+    else:
+        return NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_SR
+
+
+def _media_converters_for(capacity):
+    """Media converters and XR modules needed to serve a node capacity: list of (MC, XR, capacity)"""
+    converters = []
+    remaining_capacity = capacity
+    while remaining_capacity > 0:
+        if remaining_capacity <= 25:
+            step = (NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G, NetworkEquipmentTypeEnum.XR_MODULE_25G, 25)
+        elif remaining_capacity <= 50:
+            step = (NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G, NetworkEquipmentTypeEnum.XR_MODULE_50G, 50)
+        elif remaining_capacity <= 100:
+            step = (NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G, NetworkEquipmentTypeEnum.XR_MODULE_100G, 100)
+        elif remaining_capacity <= 200:
+            step = (NetworkEquipmentTypeEnum.MEDIA_CONVERTER_200G_8X25G, NetworkEquipmentTypeEnum.XR_MODULE_200G, 200)
+        else:
+            step = (NetworkEquipmentTypeEnum.MEDIA_CONVERTER_400G_400G, NetworkEquipmentTypeEnum.XR_MODULE_400G, 400)
+        converters.append(step)
+        remaining_capacity -= step[2]
+    return converters
+
+
+def _preaggregate(radio_equipment, term):
+    """
+    Split the radio units of a node into the ones that can be pre-aggregated (part of at least one
+    combination of 2-5 units below 25 Gbps with total <= 25 Gbps) and the others.
+    """
+    # Create a set of radio equipment that require less than 25 Gbps of capacity
+    preaggregable = [radio_eq for radio_eq in radio_equipment if radio_eq.calculate_required_capacity(term) < 25]
+
+    selected = set()
+    for r in range(2, 6):
+        for combination in combinations(preaggregable, r):
+            combination_capacity = sum(radio_eq.calculate_required_capacity(term) for radio_eq in combination)
+            if combination_capacity <= 25:
+                selected.update(combination)
+
+    preaggregated_radio_equipments = [radio_eq for radio_eq in radio_equipment if radio_eq in selected]
+    other_radio_equipments = [radio_eq for radio_eq in radio_equipment if radio_eq not in selected]
+    return preaggregated_radio_equipments, other_radio_equipments
+
+
+def dimension_node_p2p(node_type, radio_equipment, term, reach=None, uplink_optics=GREY_UPLINK_OPTICS):
+    """
+    P2P: a pair of grey SR per radio unit, grey uplink optics towards the root, switch at the node.
+    The SR pairs are patch links inside the site; the uplink optics must cover ``reach``
+    (node -> root, m): SR on the paths within their reach, LR otherwise.
+
+    :param uplink_optics: Candidate uplink optics (GREY_LR_OPTICS for the LR-only uplinks of v9 - v11)
+    """
+    total_required_capacity = 0
+    node_equipment = []
+    root_equipment = []
+    allocations = []
+    switches = []
+
+    # Calculate the total capacity required for the node
+    for radio_eq in radio_equipment:
+        required_capacity = radio_eq.calculate_required_capacity(term)
+        total_required_capacity += required_capacity
+
+        # Add a pair of grey short SR transceivers for each radio equipment
+        transceiver_type = _grey_sr_for(required_capacity)
+        node_equipment += [transceiver_type, transceiver_type]
+
+    radio_pairs = len(node_equipment)
+
+    # Add the minimum number of uplink transceivers (SR within their reach, LR beyond) to cover the capacity
+    remaining_capacity = total_required_capacity
+    while remaining_capacity > 0:
+        transceiver_type = optic_for(uplink_optics, remaining_capacity, reach)
+        remaining_capacity -= network_equipment_types[transceiver_type].data_rate
+
+        # Uplink at the node and at the root, capacity allocated along the path to the root
+        node_equipment.append(transceiver_type)
+        root_equipment.append(transceiver_type)
+        allocations.append((allocate_capacity_macro, (network_equipment_types[transceiver_type].data_rate,)))
+
+    # Calculate the total capacity of the radio SR pairs (half per transceiver) and of the uplinks
+    total_transceiver_capacity = sum(
+        (network_equipment_types[eq_enum].data_rate / 2 if index < radio_pairs
+         else network_equipment_types[eq_enum].data_rate)
+        for index, eq_enum in enumerate(node_equipment) if network_equipment_types[eq_enum].data_rate is not None
+    )
+
+    # Choose the switch size based on the total capacity
+    if total_transceiver_capacity > 0:
+        switch_type = _switch_for_capacity(total_transceiver_capacity)
+        node_equipment.append(switch_type)
+        switches.append((switch_type, total_transceiver_capacity))
+
+    return NodePlan(node_equipment, root_equipment, switches, allocations)
+
+
+@lru_cache(maxsize=None)
+def p2p_dimensioning(uplink_optics=GREY_UPLINK_OPTICS):
+    # Una sola funzione per insieme di ottiche: fa parte della chiave della memo dei NodePlan
+    return partial(dimension_node_p2p, uplink_optics=tuple(uplink_optics))
+
+
+def soluzione_1_with_smallcellswitch(T, term, root_node=0, uplink_optics=GREY_UPLINK_OPTICS):
+    initialize_node_equipment(T)
+
+    dimension_nodes(T, p2p_dimensioning(tuple(uplink_optics)), term, root_node)
+
+    # Add switches to the root node and update the energy consumption
+    add_switches_to_root(T, root_node)
+
+
+# Function to calculate the switch power consumption based on its type and total capacity
+def calculate_switch_power_consumption(switch_type, total_capacity):
+    power_model = {
+        NetworkEquipmentTypeEnum.SWITCH_SMALL: [(0, 125), (20, 131), (40, 137), (60, 144), (80, 150), (100, 156),
+                                                (120, 162), (140, 169), (160, 175), (180, 181), (200, 187), (220, 194),
+                                                (240, 200), (260, 206), (280, 212), (300, 219), (320, 225), (340, 231),
+                                                (360, 237), (380, 244), (400, 250)],
+        NetworkEquipmentTypeEnum.SWITCH_MEDIUM: [(0, 175), (80, 184), (160, 193), (240, 201), (320, 210), (400, 219),
+                                                 (480, 228), (560, 236), (640, 245), (720, 254), (800, 263), (880, 271),
+                                                 (960, 280), (1040, 289), (1120, 298), (1200, 306), (1280, 315),
+                                                 (1360, 324), (1440, 333), (1520, 341), (1600, 350)],
+        NetworkEquipmentTypeEnum.SWITCH_BIG: [(0, 230), (160, 242), (320, 253), (480, 265), (640, 276), (800, 288),
+                                              (960, 299), (1120, 311), (1280, 322), (1440, 334), (1600, 345),
+                                              (1760, 357), (1920, 368), (2080, 380), (2240, 391), (2400, 403),
+                                              (2560, 414), (2720, 426), (2880, 437), (3040, 449), (3200, 460)],
+        NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE: [(0, 310), (320, 326), (640, 341), (960, 357), (1280, 372),
+                                                      (1600, 388), (1920, 403), (2240, 419), (2560, 434), (2880, 450),
+                                                      (3200, 465), (3520, 481), (3840, 496), (4160, 512), (4480, 527),
+                                                      (4800, 543), (5120, 558), (5440, 574), (5760, 589), (6080, 605),
+                                                      (6400, 620)]
+    }
+    model = power_model[switch_type]
+
+    for i in range(len(model) - 1):
+        if model[i][0] <= total_capacity < model[i + 1][0]:
+            return model[i][1]
+
+    return model[-1][1]
+
+
+def add_switch_consumption(T, node, switch_type, load):
+    """
+    Add the power of a switch at its peak load to the node and keep (switch type, peak load)
+    in 'switch_loads' for the hourly energy model.
+    """
+    T.nodes[node]['switching_consumption'] += calculate_switch_power_consumption(switch_type, load)
+    T.nodes[node].setdefault('switch_loads', []).append((switch_type, load))
+
+
+def add_switches_to_root(T, root_node=0):
+    # Total capacity of the transceivers at the root node, from its running counters
+    total_capacity = node_counters(T, root_node).capacity
+
+    total_capacity_for_energy = total_capacity
+
+    # Add switches until all required capacity is supported
+    while total_capacity > 0:
+        if total_capacity <= 400:
+            switch_type = NetworkEquipmentTypeEnum.SWITCH_SMALL
+            total_capacity -= 400
+        elif total_capacity <= 1600:
+            switch_type = NetworkEquipmentTypeEnum.SWITCH_MEDIUM
+            total_capacity -= 1600
+        elif total_capacity <= 3200:
+            switch_type = NetworkEquipmentTypeEnum.SWITCH_BIG
+            total_capacity -= 3200
+        else:
+            switch_type = NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE
+            total_capacity -= 6400  # Capacity of the extra large switch
+
+        add_network_equipment(T, root_node, switch_type)
+        add_switch_consumption(T, root_node, switch_type, total_capacity_for_energy)
+
+
+def allocate_capacity_wdm_on_path_macro(T, path, radio_equipment, term):
+    if not path:
+        return  # If the path is empty, do nothing
+
+    # Create two new fibers for the entire path
+    new_fibers = [Fiber(), Fiber()]
+
+    for i in range(len(path) - 1):
+        u, v = path[i], path[i + 1]
+
+        if not T.has_edge(u, v):
+            print(f"Edge ({u}, {v}) does not exist in the graph. Skipping allocation.")
+            continue  # Skip allocation if the edge does not exist
+
+        if 'fibers' not in T.edges[u, v]:
+            T.edges[u, v]['fibers'] = []
+
+        # Add the two new fibers to the current edge
+        T.edges[u, v]['fibers'].extend(new_fibers)
+
+        # Use the newly created fibers for all allocations of this set of radio equipment
+        fibers_to_use = new_fibers
+
+        for fiber in fibers_to_use:
+            for equipment in radio_equipment:
+                required_capacity = equipment.calculate_required_capacity(term)
+                for wavelength, current_capacity in fiber.wavelengths.items():
+                    if current_capacity == 0:
+                        fiber.wavelengths[wavelength] = required_capacity
+                        break  # Exit the loop after occupying the capacity
+
+
+def allocate_capacity_wdm_on_path_small(T, path, radio_equipment, term, with_mux=False):
+    if with_mux:
+        # If with_mux is True, call allocate_capacity_wdm_on_path_macro
+        allocate_capacity_wdm_on_path_macro(T, path, radio_equipment, term)
+        return
+
+    if not path:
+        return  # If the path is empty, do nothing
+
+    for i in range(len(path) - 1):
+        u, v = path[i], path[i + 1]
+
+        if not T.has_edge(u, v):
+            print(f"Edge ({u}, {v}) does not exist in the graph. Skipping allocation.")
+            continue  # Skip allocation if the edge does not exist
+
+        if 'fibers' not in T.edges[u, v]:
+            T.edges[u, v]['fibers'] = []
+
+        # Add two new fibers for each radio equipment
+        T.edges[u, v]['fibers'].append(Fiber())
+        T.edges[u, v]['fibers'].append(Fiber())
+
+        fibers_to_use = T.edges[u, v]['fibers'][-2:]  # Use the last two added fibers
+
+        for fiber in fibers_to_use:
+            allocated_wavelengths = 0
+            for equipment in radio_equipment:
+                required_capacity = equipment.calculate_required_capacity(term)
+                for wavelength, current_capacity in fiber.wavelengths.items():
+                    if current_capacity == 0:
+                        fiber.wavelengths[wavelength] = required_capacity
+                        allocated_wavelengths += 1
+                        break  # Exit the loop after occupying the capacity
+                if allocated_wavelengths >= len(radio_equipment):
+                    break
+
+
+def add_required_transponders(T, node):
+    """
+    Adds to the node the transponders needed to serve its WDM transceivers
+    (one transponder per num_ports transceivers), as one counted entry.
+    """
+    wdm_transceivers_count = node_counters(T, node).wdm_transceivers
+
+    transponder_type = NetworkEquipmentTypeEnum.TRANSPONDER
+    transponder_ports = network_equipment_types[transponder_type].num_ports
+
+    # Calculate how many transponders are needed to cover all WDM transceivers
+    num_transponders_needed = (wdm_transceivers_count + transponder_ports - 1) // transponder_ports
+
+    # One counted entry for all the transponders of the node
+    if num_transponders_needed:
+        add_network_equipment(T, node, transponder_type, num_transponders_needed)
+        T.nodes[node]['other_consumption'] += \
+            network_equipment_types[transponder_type].max_power * num_transponders_needed
+
+
+def add_required_transponders_to_root(T, root_node):
+    """Transponders of the root, sized like those of any other node"""
+    return add_required_transponders(T, root_node)
+
+
+def dimension_node_wdm(node_type, radio_equipment, term, reach=None):
+    """WDM: grey SR pair + WDM LR per radio unit at node and root, WDM mux on both sides"""
+    node_equipment = []
+    root_equipment = []
+
+    if node_type not in (1, 2):
+        return NodePlan()
+
+    for radio_eq in radio_equipment:
+        required_capacity = radio_eq.calculate_required_capacity(term)
+
+        # Add a pair of short SR transceivers with sufficient capacity
+        transceiver_type = _grey_sr_for(required_capacity)
+        wdm_transceiver_type = _wdm_lr_for(required_capacity, reach)
+
+        # una coppia di SR e un WDM LR, sul nodo e sulla root
+        node_equipment += [transceiver_type, transceiver_type, wdm_transceiver_type]
+        root_equipment += [transceiver_type, transceiver_type, wdm_transceiver_type]
+
+    # Add a WDM multiplexer only if the number of radio equipments is greater than 0
+    if len(radio_equipment) > 0:
+        node_equipment.append(NetworkEquipmentTypeEnum.WDM_MUX)
+        root_equipment.append(NetworkEquipmentTypeEnum.WDM_MUX)
+
+    # Allocate capacity along the path to the root node
+    if node_type == 1:  # Macro node
+        allocation = (allocate_capacity_wdm_on_path_macro, (radio_equipment, term))
+    else:  # Small node
+        allocation = (allocate_capacity_wdm_on_path_small, (radio_equipment, term, True))
+
+    return NodePlan(node_equipment, root_equipment, allocations=[allocation])
+
+
+def soluzione_2_with_smallcellmux(T, term, root_node=0):
+    initialize_node_equipment(T)
+
+    for node, plan in dimension_nodes(T, dimension_node_wdm, term, root_node).items():
+        # Add the required transponders based on the number of WDM transceivers
+        add_required_transponders(T, node)
+
+    add_required_transponders_to_root(T, root_node)
+    # Add the extra large switch at the root node
+    add_switches_to_root(T, root_node)
+
+
+def allocate_capacity_xr_on_path_macro(T, path, total_capacity):
+    for i in range(len(path) - 1):
+        u, v = path[i], path[i + 1]
+
+        if 'fibers' not in T.edges[u, v]:
+            T.edges[u, v]['fibers'] = []
+
+        # Create two new fibers for the entire path
+        T.edges[u, v]['fibers'].append(Fiber())
+        T.edges[u, v]['fibers'].append(Fiber())
+
+        fibers_to_use = T.edges[u, v]['fibers'][-2:]  # Use the last two added fibers
+
+        # Occupy one wavelength on each fiber
+        for fiber in fibers_to_use:
+            for wavelength, current_capacity in fiber.wavelengths.items():
+                if current_capacity == 0:
+                    fiber.wavelengths[wavelength] = total_capacity
+                    break  # Exit the loop after occupying the capacity
+
+
+# Energy consumption models based on switch type and traffic (linear interpolation)
+SWITCH_ENERGY_MODEL = {
+    "Small": [
+        (0, 125), (20, 131), (40, 137), (60, 144), (80, 150), (100, 156), (120, 162), (140, 169), (160, 175),
+        (180, 181), (200, 187), (220, 194), (240, 200), (260, 206), (280, 212), (300, 219), (320, 225),
+        (340, 231), (360, 237), (380, 244), (400, 250)
+    ],
+    "Medium": [
+        (0, 175), (80, 184), (160, 193), (240, 201), (320, 210), (400, 219), (480, 228), (560, 236), (640, 245),
+        (720, 254), (800, 263), (880, 271), (960, 280), (1040, 289), (1120, 298), (1200, 306), (1280, 315),
+        (1360, 324), (1440, 333), (1520, 341), (1600, 350)
+    ],
+    "Large": [
+        (0, 230), (160, 242), (320, 253), (480, 265), (640, 276), (800, 288), (960, 299), (1120, 311),
+        (1280, 322), (1440, 334), (1600, 345), (1760, 357), (1920, 368), (2080, 380), (2240, 391), (2400, 403),
+        (2560, 414), (2720, 426), (2880, 437), (3040, 449), (3200, 460)
+    ],
+    "Extra Large": [
+        (0, 310), (320, 326), (640, 341), (960, 357), (1280, 372), (1600, 388), (1920, 403), (2240, 419),
+        (2560, 434), (2880, 450), (3200, 465), (3520, 481), (3840, 496), (4160, 512), (4480, 527), (4800, 543),
+        (5120, 558), (5440, 574), (5760, 589), (6080, 605), (6400, 620)
+    ]
+}
+
+# Curve of SWITCH_ENERGY_MODEL used by each switch of the catalog
+SWITCH_ENERGY_CURVES = {
+    NetworkEquipmentTypeEnum.SWITCH_SMALL: "Small",
+    NetworkEquipmentTypeEnum.SWITCH_MEDIUM: "Medium",
+    NetworkEquipmentTypeEnum.SWITCH_BIG: "Large",
+    NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE: "Extra Large",
+}
+
+
+def calculate_switch_energy(switch_type, total_traffic_gbps):
+    """
+    Calculate the energy consumption of a switch based on its type and the total traffic handled.
+
+    :param switch_type: Switch type ("Small", "Medium", "Large", "Extra Large")
+    :param total_traffic_gbps: Total traffic handled by the switch in Gbps
+    :return: Energy consumption in Watts
+    """
+    power_model = SWITCH_ENERGY_MODEL
+    if switch_type not in power_model:
+        raise ValueError("Tipo di switch non valido. Scegli tra 'Small', 'Medium', 'Large', 'Extra Large'.")
+
+    # Find the energy consumption corresponding to the total traffic
+    model = power_model[switch_type]
+    for i in range(len(model) - 1):
+        (traffic_1, power_1), (traffic_2, power_2) = model[i], model[i + 1]
+        if traffic_1 <= total_traffic_gbps <= traffic_2:
+            # Linear interpolation between the two points
+            return power_1 + (power_2 - power_1) * (total_traffic_gbps - traffic_1) / (traffic_2 - traffic_1)
+
+    # If the total traffic exceeds the maximum value in the model, return the last consumption value
+    return model[-1][1]
+
+
+def allocate_capacity_xr_on_path_small(T, path, radio_equipment, term):
+    if not path:
+        return  # If the path is empty, do nothing
+
+    for radio_eq in radio_equipment:
+        required_capacity = radio_eq.calculate_required_capacity(term)
+
+        for i in range(len(path) - 1):
+            u, v = path[i], path[i + 1]
+
+            if 'fibers' not in T.edges[u, v]:
+                T.edges[u, v]['fibers'] = []
+
+            # Add two new fibers for each radio equipment
+            T.edges[u, v]['fibers'].append(Fiber())
+            T.edges[u, v]['fibers'].append(Fiber())
+
+            fibers_to_use = T.edges[u, v]['fibers'][-2:]  # Use the last two added fibers
+
+            # Occupy one wavelength on each fiber
+            for fiber in fibers_to_use:
+                for wavelength, current_capacity in fiber.wavelengths.items():
+                    if current_capacity == 0:
+                        fiber.wavelengths[wavelength] = required_capacity
+                        break  # Exit the loop after occupying the capacity
+
+
+def dimension_node_wdm_wp(node_type, radio_equipment, term, reach=None):
+    """
+    WDM-WP: WDM with pre-aggregation on all nodes (Macro and Small). The pre-aggregable radio
+    units share one WDM LR behind a switch, the others are served as in the WDM solution.
+    """
+    node_equipment = []
+    root_equipment = []
+    switches = []
+
+    preaggregated_radio_equipments, other_radio_equipments = _preaggregate(radio_equipment, term)
+
+    if preaggregated_radio_equipments:
+        # Calculate the total capacity of the pre-aggregated radio equipment
+        preaggregated_capacity = sum(
+            radio_eq.calculate_required_capacity(term) for radio_eq in preaggregated_radio_equipments)
+
+        # Add grey transceivers for the pre-aggregated radio equipment
+        for radio_eq in preaggregated_radio_equipments:
+            transceiver_type = _grey_sr_for(radio_eq.calculate_required_capacity(term))
+            node_equipment += [transceiver_type, transceiver_type]
+
+        # Add one WDM transceiver to cover the total pre-aggregated capacity
+        wdm_transceiver_type = _wdm_lr_for(preaggregated_capacity, reach)
+        node_equipment.append(wdm_transceiver_type)
+        root_equipment.append(wdm_transceiver_type)
+
+        # Add corresponding SR transceivers at root for pre-aggregated capacity
+        remaining_capacity = preaggregated_capacity
+        while remaining_capacity > 0:
+            if remaining_capacity <= 1:
+                transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_1G_SR
+                remaining_capacity -= 1
+            elif remaining_capacity <= 10:
+                transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_10G_SR
+                remaining_capacity -= 10
+            elif remaining_capacity <= 25:
+                transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR
+                remaining_capacity -= 25
+            elif remaining_capacity <= 50:
+                transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_SR
+                remaining_capacity -= 50
+            elif remaining_capacity <= 100:
+                transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_SR
+                remaining_capacity -= 100
+            else:
+                transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_SR
+                remaining_capacity -= 400
+
+            root_equipment += [transceiver_type, transceiver_type]
+
+        # Add a switch to support the total pre-aggregated capacity
+        if preaggregated_capacity > 0:
+            switch_type = _switch_for_capacity(preaggregated_capacity)
+            node_equipment.append(switch_type)
+            switches.append((switch_type, preaggregated_capacity))
+
+    # Handle remaining radio equipment that is not pre-aggregated (same as standard WDM)
+    for radio_eq in other_radio_equipments:
+        required_capacity = radio_eq.calculate_required_capacity(term)
+        transceiver_type = _grey_sr_for(required_capacity)
+        wdm_transceiver_type = _wdm_lr_for(required_capacity, reach)
+
+        node_equipment += [transceiver_type, transceiver_type, wdm_transceiver_type]
+        root_equipment += [transceiver_type, transceiver_type, wdm_transceiver_type]
+
+    # Add WDM multiplexer only if there are radio equipments (considering both pre-aggregated and others)
+    if len(radio_equipment) > 0:
+        node_equipment.append(NetworkEquipmentTypeEnum.WDM_MUX)
+        root_equipment.append(NetworkEquipmentTypeEnum.WDM_MUX)
+
+    # Allocate capacity along the path to the root node
+    allocation = (allocate_capacity_wdm_on_path_macro, (radio_equipment, term))
+
+    return NodePlan(node_equipment, root_equipment, switches, [allocation])
+
+
+def soluzione_2_with_smallcellaggr_with_preaggregation(T, term, root_node=0):
+    """
+    WDM-WP Solution: WDM with small cell aggregation and pre-aggregation
+    This solution combines the WDM approach with pre-aggregation logic for all nodes
+    """
+    initialize_node_equipment(T)
+
+    for node, plan in dimension_nodes(T, dimension_node_wdm_wp, term, root_node).items():
+        # Add required transponders
+        add_required_transponders(T, node)
+
+    # Add transponders to root and switches
+    add_required_transponders_to_root(T, root_node)
+    add_switches_to_root(T, root_node)
+
+
+def _p2mp_node_plan(node_equipment, switches, total_node_transceiver_capacity):
+    # Add media converters and related XR modules needed to serve the node's total capacity
+    media_converter_capacity = 0
+    for media_converter_type, xr_module_type, capacity in _media_converters_for(total_node_transceiver_capacity):
+        node_equipment += [media_converter_type, xr_module_type]
+        media_converter_capacity += capacity
+
+    # Allocate capacity along the path to the root node
+    allocation = (allocate_capacity_xr_on_path_macro, (media_converter_capacity,))
+    return NodePlan(node_equipment, (), switches, [allocation], root_capacity=media_converter_capacity)
+
+
+def dimension_node_p2mp(node_type, radio_equipment, term, reach=None):
+    """
+    P2MP: a pair of grey SR per radio unit, media converters and XR leaf modules at the node.
+    ``reach`` is accepted as by the other solutions: the XR modules (≈ 200 km) cover every path.
+    """
+    total_node_transceiver_capacity = 0
+    node_equipment = []
+
+    # Iterate over each radio equipment of the node
+    for radio_eq in radio_equipment:
+        # Add a pair of SR transceivers with sufficient capacity
+        transceiver_type = _p2mp_sr_for(radio_eq.calculate_required_capacity(term))
+        node_equipment += [transceiver_type, transceiver_type]
+
+        # Increase the capacity of the selected transceiver (data_rate)
+        total_node_transceiver_capacity += network_equipment_types[transceiver_type].data_rate
+
+    return _p2mp_node_plan(node_equipment, [], total_node_transceiver_capacity)
+
+
+def add_xr_hub_modules_to_root(T, total_root_capacity, root_node=0):
+    """Add XR hub modules at the root node to serve the total capacity of all media converters"""
+    remaining_root_capacity = total_root_capacity
+    while remaining_root_capacity > 0:
+        if remaining_root_capacity <= 25:
+            xr_module_type = NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G
+            remaining_root_capacity -= 25
+        elif remaining_root_capacity <= 50:
+            xr_module_type = NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G
+            remaining_root_capacity -= 50
+        elif remaining_root_capacity <= 100:
+            xr_module_type = NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G
+            remaining_root_capacity -= 100
+        elif remaining_root_capacity <= 200:
+            xr_module_type = NetworkEquipmentTypeEnum.XR_MODULE_HUB_200G
+            remaining_root_capacity -= 200
+        else:
+            xr_module_type = NetworkEquipmentTypeEnum.XR_MODULE_HUB_400G
+            remaining_root_capacity -= 400
+
+        add_network_equipment(T, root_node, xr_module_type)
+
+        # Update the root node's `other_consumption` energy usage
+        T.nodes[root_node]['other_consumption'] += network_equipment_types[xr_module_type].max_power
+
+
+def soluzione_3_with_smallcellaggr(T, term, root_node=0):
+    initialize_node_equipment(T)
+
+    plans = dimension_nodes(T, dimension_node_p2mp, term, root_node)
+
+    # Total capacity that will be served by the root
+    total_root_capacity = sum(plan.root_capacity for plan in plans.values())
+    add_xr_hub_modules_to_root(T, total_root_capacity, root_node)
+
+    # Add the extra large switch at the root node and update the energy consumption
+    add_switches_to_root(T, root_node)
+
+
+def dimension_node_p2mp_wp(node_type, radio_equipment, term, reach=None):
+    """
+    P2MP-WP: P2MP with pre-aggregation; the pre-aggregable radio units are switched onto
+    25G SR pairs before the media converters.
+    """
+    total_node_transceiver_capacity = 0
+    node_equipment = []
+    switches = []
+
+    preaggregated_radio_equipments, other_radio_equipments = _preaggregate(radio_equipment, term)
+
+    if preaggregated_radio_equipments:
+        # Calculate the total capacity of the pre-aggregated radio equipment
+        preaggregated_capacity = sum(
+            radio_eq.calculate_required_capacity(term) for radio_eq in preaggregated_radio_equipments)
+
+        # Add grey transceivers for the pre-aggregated radio equipment
+        for radio_eq in preaggregated_radio_equipments:
+            transceiver_type = _grey_sr_for(radio_eq.calculate_required_capacity(term))
+            node_equipment += [transceiver_type, transceiver_type]
+
+        # Add grey transceivers to cover the total pre-aggregated capacity
+        remaining_capacity = preaggregated_capacity
+        while remaining_capacity > 0:
+            transceiver_type = NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR
+            remaining_capacity -= 25
+            node_equipment += [transceiver_type, transceiver_type]
+            total_node_transceiver_capacity += network_equipment_types[transceiver_type].data_rate
+
+        # Add a switch to support the total pre-aggregated capacity
+        if preaggregated_capacity > 0:
+            switch_type = _switch_for_capacity(preaggregated_capacity)
+            node_equipment.append(switch_type)
+            switches.append((switch_type, preaggregated_capacity))
+
+    # Iterate over the remaining radio equipment that is not pre-aggregated
+    for radio_eq in other_radio_equipments:
+        # Add a pair of SR transceivers with sufficient capacity
+        transceiver_type = _p2mp_sr_for(radio_eq.calculate_required_capacity(term))
+        node_equipment += [transceiver_type, transceiver_type]
+
+        # Increase the capacity of the selected transceiver (data_rate)
+        total_node_transceiver_capacity += network_equipment_types[transceiver_type].data_rate
+
+    return _p2mp_node_plan(node_equipment, switches, total_node_transceiver_capacity)
+
+
+def soluzione_3_with_smallcellaggr_with_preaggregation(T, term, root_node=0):
+    initialize_node_equipment(T)
+
+    plans = dimension_nodes(T, dimension_node_p2mp_wp, term, root_node)
+
+    # Total capacity that will be served by the root
+    total_root_capacity = sum(plan.root_capacity for plan in plans.values())
+    add_xr_hub_modules_to_root(T, total_root_capacity, root_node)
+
+    # Add the extra large switch at the root node
+    add_switches_to_root(T, root_node)
+
+
+# ============================================
+# REGISTRY DELLE SOLUZIONI
+# ============================================
+
+class SolutionStrategy:
+    """
+    A fronthaul solution strategy: the name used in results and plots, the dimensioning
+    function, the catalog entries the dimensioning can place on the nodes, whether its
+    cost/power depend on the XR (P2MP) catalog cases and the dimensioning options (keyword
+    arguments of the solution function) it accepts.
+    """
+
+    def __init__(self, name, solution_fn, equipment, uses_xr=False, options=()):
+        self.name = name
+        self.solution_fn = solution_fn
+        self.equipment = tuple(equipment)
+        self.uses_xr = uses_xr
+        self.options = tuple(options)
+
+    def apply(self, T, term, root_node=0, **options):
+        """Dimension T; the options the solution does not accept are ignored"""
+        self.solution_fn(T, term, root_node, **{key: value for key, value in options.items() if key in self.options})
+        return T
+
+    def evaluate(self, scenario, term, with_corners=False):
+        """
+        Build the geotype, deploy the radio equipment and dimension it with this solution.
+
+        :param with_corners: Dimension T_m, whose fibers follow the streets through the corner nodes
+        """
+        T, T_m, A = create_geotype(scenario)
+        if with_corners:
+            T = T_m
+        deploy_radio_equipment(T, term, scenario)
+        self.solution_fn(T, term)
+        return T, A
+
+    def evaluate_batch(self, grid, measure):
+        """
+        Batch entry point: evaluate the solution on every (scenario, term) of the grid.
+
+        :param grid: Iterable of (scenario, term) pairs
+        :param measure: Function (T, A) -> dict of metrics
+        :return: List of records with Solution, Term, Scenario and the measured metrics
+        """
+        records = []
+        for scenario, term in grid:
+            T, A = self.evaluate(scenario, term)
+            record = {'Solution': self.name, 'Term': term, 'Scenario': scenario}
+            record.update(measure(T, A))
+            records.append(record)
+        return records
+
+
+SOLUTION_REGISTRY = {}
+
+
+def register_solution(strategy):
+    SOLUTION_REGISTRY[strategy.name] = strategy
+    return strategy
+
+
+def get_solutions(names=None):
+    """Registered strategies in registration order, optionally restricted to the given names"""
+    if names is None:
+        return list(SOLUTION_REGISTRY.values())
+    return [SOLUTION_REGISTRY[name] for name in names]
+
+
+def evaluate_solutions(temporal_scenarios, deployment_scenarios, measure, names=None):
+    """
+    Evaluate every registered solution (or the given subset) over term × scenario
+    and collect the measured metrics as a list of records.
+    """
+    grid = [(scenario, term) for term in temporal_scenarios for scenario in deployment_scenarios]
+    records = []
+    for strategy in get_solutions(names):
+        records.extend(strategy.evaluate_batch(grid, measure))
+    return records
+
+
+def _equipment_family(*prefixes):
+    return [eq_enum for eq_enum in NetworkEquipmentTypeEnum if eq_enum.name.startswith(prefixes)]
+
+
+SWITCHES = _equipment_family('SWITCH_')
+
+register_solution(SolutionStrategy(
+    'P2P', soluzione_1_with_smallcellswitch,
+    _equipment_family('GREY_TRANSCEIVERS_') + SWITCHES,
+    options=('uplink_optics',)))
+register_solution(SolutionStrategy(
+    'WDM', soluzione_2_with_smallcellmux,
+    _equipment_family('GREY_TRANSCEIVERS_', 'WDM_TRANSCEIVERS_', 'WDM_MUX', 'TRANSPONDER') + SWITCHES))
+register_solution(SolutionStrategy(
+    'WDM-WP', soluzione_2_with_smallcellaggr_with_preaggregation,
+    _equipment_family('GREY_TRANSCEIVERS_', 'WDM_TRANSCEIVERS_', 'WDM_MUX', 'TRANSPONDER') + SWITCHES))
+register_solution(SolutionStrategy(
+    'P2MP', soluzione_3_with_smallcellaggr,
+    [NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_SR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_SR,
+     NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_SR, NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_SR]
+    + _equipment_family('MEDIA_CONVERTER_', 'XR_MODULE_') + SWITCHES,
+    uses_xr=True))
+register_solution(SolutionStrategy(
+    'P2MP-WP', soluzione_3_with_smallcellaggr_with_preaggregation,
+    [eq_enum for eq_enum in _equipment_family('GREY_TRANSCEIVERS_') if eq_enum.name.endswith('_SR')]
+    + _equipment_family('MEDIA_CONVERTER_', 'XR_MODULE_') + SWITCHES,
+    uses_xr=True))
+
+# Cost components used for the transmission / switching breakdown
+TX_COMPONENTS = ["GREY_TRANSCEIVERS", "WDM_TRANSCEIVERS", "XR_MODULE", "MEDIA_CONVERTER", "TRANSPONDER"]
+SWITCHING_COMPONENTS = ["SWITCH_SMALL", "SWITCH_MEDIUM", "SWITCH_BIG", "SWITCH_EXTRA_LARGE", "WDM_MUX"]
+
+
+# ============================================
+# COSTI ED ENERGIA
+# ============================================
+
+# Function to calculate the total cost of network equipment in a graph
+def calculate_total_cost(T):
+    transceiver_cost = calculate_cost_component(T, TX_COMPONENTS)
+    switching_cost = calculate_cost_component(T, SWITCHING_COMPONENTS)
+    total_cost = transceiver_cost + switching_cost
+    return total_cost
+    '''
+    total_normalized_cost = 0
+    for node in T.nodes():
+        for ne in T.nodes[node].get('network_equipment', []):
+            total_normalized_cost += ne.normalized_price
+
+    return total_normalized_cost
+    '''
+
+
+def count_fibers(T):
+    plant = FiberPlant(T)
+    return plant.per_edge(plant.fibers)
+
+
+def calculate_total_energy_consumption(T):
+    """Calcola consumo energetico totale annuale in MWh"""
+    switching_consumption = sum(T.nodes[node]['switching_consumption'] for node in T.nodes())
+    other_consumption = sum(T.nodes[node]['other_consumption'] for node in T.nodes())
+    total_annual_mwh = (switching_consumption + other_consumption) * 365 * 24 / 1000000
+    return total_annual_mwh
+
+
+def calculate_energy_component(T, component_type):
+    """Calcola consumo energetico per componente specifico in MWh"""
+    consumption = sum(T.nodes[node][component_type] for node in T.nodes())
+    annual_mwh = consumption * 365 * 24 / 1000000
+    return annual_mwh
+
+
+def calculate_hourly_energy_consumption(T, profile=None, sleep_mode=None):
+    """
+    Consumo energetico annuo in MWh su un profilo di traffico orario (8760 ore).
+
+    Ogni switch segue la curva interpolata di calculate_switch_energy al carico orario
+    (carico di picco registrato in 'switch_loads' × profilo); gli altri apparati consumano
+    la loro max_power, ridotta nelle ore di sleep se sleep_mode è dato.
+
+    :param profile: Carico orario come frazione del picco (default yearly_profile())
+    :param sleep_mode: SleepMode opzionale
+    :return: Dict con 'Switching Energy', 'Transmission Energy', 'Total Energy'
+    """
+    switch_loads = [(SWITCH_ENERGY_CURVES[switch_type], load)
+                    for node in T.nodes() for switch_type, load in T.nodes[node].get('switch_loads', [])]
+    static_power = sum(T.nodes[node]['other_consumption'] for node in T.nodes())
+    return hourly_energy(switch_loads, static_power, SWITCH_ENERGY_MODEL, profile, sleep_mode)
+
+
+def measure_cost_and_energy(T):
+    """Costi (totale, TX, MUX) ed energia (totale, TX, SW) di una rete dimensionata"""
+    return {
+        'Total Cost': calculate_total_cost(T),
+        'TX Cost': calculate_cost_component(T, TX_COMPONENTS),
+        'MUX Cost': calculate_cost_component(T, SWITCHING_COMPONENTS),
+        'Total Energy': calculate_total_energy_consumption(T),
+        'TX Energy': calculate_energy_component(T, 'other_consumption'),
+        'SW Energy': calculate_energy_component(T, 'switching_consumption')
+    }
+
+
+# ============================================
+# CATALOGO XR: ALPHA E BEST/WORST CASE
+# ============================================
+
+def update_xr_costs_based_on_grey_lr(network_equipment_types, NetworkEquipmentTypeEnum, alpha):
+    """
+    Aggiorna i costi XR basandosi sui costi dei GREY LR transceivers moltiplicati per alpha
+    """
+    # Mapping tra XR modules e corrispondenti GREY LR transceivers
+    xr_to_grey_mapping = {
+        NetworkEquipmentTypeEnum.XR_MODULE_25G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_25G_LR,
+        NetworkEquipmentTypeEnum.XR_MODULE_50G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_50G_LR,
+        NetworkEquipmentTypeEnum.XR_MODULE_100G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR,
+        NetworkEquipmentTypeEnum.XR_MODULE_200G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR,  # 2x100G
+        NetworkEquipmentTypeEnum.XR_MODULE_400G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_LR,
+        NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR,
+        NetworkEquipmentTypeEnum.XR_MODULE_HUB_200G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR,  # 2x100G
+        NetworkEquipmentTypeEnum.XR_MODULE_HUB_400G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_LR,
+    }
+
+    # Aggiorna i costi XR modules
+    for xr_enum, grey_enum in xr_to_grey_mapping.items():
+        grey_normalized_cost = network_equipment_types[grey_enum].normalized_price
+
+        # Per moduli 200G, usa 2x il costo del 100G
+        if "200G" in xr_enum.name:
+            network_equipment_types[xr_enum].normalized_price = 2 * grey_normalized_cost * alpha
+        else:
+            network_equipment_types[xr_enum].normalized_price = grey_normalized_cost * alpha
+
+    # Aggiorna i media converter costs (50% del costo XR corrispondente)
+    media_converter_mapping = {
+        NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR,
+        NetworkEquipmentTypeEnum.MEDIA_CONVERTER_200G_8X25G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_100G_LR,
+        # 2x100G
+        NetworkEquipmentTypeEnum.MEDIA_CONVERTER_400G_400G: NetworkEquipmentTypeEnum.GREY_TRANSCEIVERS_400G_LR,
+    }
+
+    for mc_enum, grey_enum in media_converter_mapping.items():
+        grey_normalized_cost = network_equipment_types[grey_enum].normalized_price
+
+        if "200G" in mc_enum.name:
+            network_equipment_types[mc_enum].normalized_price = 2 * grey_normalized_cost * alpha * 0.5
+        else:
+            network_equipment_types[mc_enum].normalized_price = grey_normalized_cost * alpha * 0.5
+
+
+# Definizione dei costi e consumi per XR modules - Best e Worst case
+XR_COSTS = {
+    'best': {
+        'XR_100G': 1.0,  # CU
+        'XR_200G': 1.2,  # CU
+        'XR_400G': 1.4  # CU
+    },
+    'worst': {
+        'XR_100G': 1.5,  # CU
+        'XR_200G': 1.8,  # CU
+        'XR_400G': 2.1  # CU
+    }
+}
+
+XR_CASES = ['best', 'worst']
+
+XR_POWER = {
+    'best': {
+        'XR_100G': 5.5,  # W
+        'XR_200G': 13.5,  # W
+        'XR_400G': 22.0  # W
+    },
+    'worst': {
+        'XR_100G': 7.2,  # W
+        'XR_200G': 18.0,  # W
+        'XR_400G': 29.0  # W
+    }
+}
+
+def update_xr_equipment_scenario(network_equipment_types, NetworkEquipmentTypeEnum, case='best'):
+    """
+    Aggiorna costi e consumi energetici per XR equipment basandosi su best/worst case
+    """
+    if case not in ['best', 'worst']:
+        raise ValueError("Case deve essere 'best' o 'worst'")
+
+    # Update XR modules da 25G a 100G
+    if '25G' in NetworkEquipmentTypeEnum.XR_MODULE_25G.name:
+        network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_25G].normalized_price = XR_COSTS[case][
+                                                                                               'XR_100G'] * 0.25
+        network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_25G].max_power = XR_POWER[case]['XR_100G'] * 0.25
+
+    if '50G' in NetworkEquipmentTypeEnum.XR_MODULE_50G.name:
+        network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_50G].normalized_price = XR_COSTS[case][
+                                                                                               'XR_100G'] * 0.5
+        network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_50G].max_power = XR_POWER[case]['XR_100G'] * 0.5
+
+    # XR 100G modules
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_100G].normalized_price = XR_COSTS[case]['XR_100G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_100G].max_power = XR_POWER[case]['XR_100G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G].normalized_price = XR_COSTS[case]['XR_100G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_HUB_100G].max_power = XR_POWER[case]['XR_100G']
+
+    # XR 200G modules
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_200G].normalized_price = XR_COSTS[case]['XR_200G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_200G].max_power = XR_POWER[case]['XR_200G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_HUB_200G].normalized_price = XR_COSTS[case]['XR_200G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_HUB_200G].max_power = XR_POWER[case]['XR_200G']
+
+    # XR 400G modules
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_400G].normalized_price = XR_COSTS[case]['XR_400G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_400G].max_power = XR_POWER[case]['XR_400G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_HUB_400G].normalized_price = XR_COSTS[case]['XR_400G']
+    network_equipment_types[NetworkEquipmentTypeEnum.XR_MODULE_HUB_400G].max_power = XR_POWER[case]['XR_400G']
+
+    # Media converters - 50% del costo XR, 30% del consumo
+    network_equipment_types[NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G].normalized_price = XR_COSTS[case][
+                                                                                                        'XR_100G'] * 0.5
+    network_equipment_types[NetworkEquipmentTypeEnum.MEDIA_CONVERTER_100G_4X25G].max_power = XR_POWER[case][
+                                                                                                 'XR_100G'] * 0.3
+
+    network_equipment_types[NetworkEquipmentTypeEnum.MEDIA_CONVERTER_200G_8X25G].normalized_price = XR_COSTS[case][
+                                                                                                        'XR_200G'] * 0.5
+    network_equipment_types[NetworkEquipmentTypeEnum.MEDIA_CONVERTER_200G_8X25G].max_power = XR_POWER[case][
+                                                                                                 'XR_200G'] * 0.3
+
+    network_equipment_types[NetworkEquipmentTypeEnum.MEDIA_CONVERTER_400G_400G].normalized_price = XR_COSTS[case][
+                                                                                                       'XR_400G'] * 0.5
+    network_equipment_types[NetworkEquipmentTypeEnum.MEDIA_CONVERTER_400G_400G].max_power = XR_POWER[case][
+                                                                                                'XR_400G'] * 0.3
@@ -0,0 +1,135 @@
+"""
+Asynchronous output stage for the analysis scripts.
+
+CSV tables and figures are queued as soon as their data is ready and written by an asyncio
+loop running in a background thread, which hands the blocking writers to thread pools while
+the script goes on with the next section:
+
+    exporter = ExportOrchestrator()
+    exporter.write_csv(df, 'best_worst_case_analysis.csv', index=False)
+    exporter.save_figure(plt.gcf(), 'cost_comparison.pdf', format='pdf', dpi=300)
+    ...
+    exporter.close()   # waits for every artifact, raises ExportError if any failed
+
+Forking a process while other threads run can deadlock the child (a lock held by a thread is
+copied locked), so call exporter.suspend() before a section that starts a fork pool: it
+writes what is queued and stops the threads, which are started again by the next export.
+
+Tables are copied when queued, so the caller may keep modifying them. Matplotlib is not
+thread-safe: figures are detached from pyplot when queued and rendered one at a time on a
+dedicated thread; with an interactive backend they are saved synchronously instead, so that
+plt.show() still displays them.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Backend senza finestre: le figure possono essere salvate in background
+NON_INTERACTIVE_BACKENDS = ('agg', 'pdf', 'ps', 'svg', 'pgf', 'cairo', 'template')
+
+
+class ExportError(RuntimeError):
+    def __init__(self, failures):
+        self.failures = failures
+        super().__init__(f"{len(failures)} exports failed: " +
+                         '; '.join(f"{path}: {error!r}" for path, error in failures))
+
+
+class ExportOrchestrator:
+    """
+    Queue of output artifacts written concurrently with the computation.
+
+    :param max_workers: Threads for the table and generic writers
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._loop = None  # Loop e thread partono alla prima esportazione
+        self._pending = []
+        self.written = []  # (path, seconds)
+        self.failures = []  # (path, exception)
+
+    def _start(self):
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='export-loop', daemon=True)
+        self._thread.start()
+        self._writers = ThreadPoolExecutor(self.max_workers, thread_name_prefix='export')
+        self._figures = ThreadPoolExecutor(1, thread_name_prefix='export-figures')
+
+    async def _write(self, executor, path, writer):
+        start = time.perf_counter()
+        try:
+            await self._loop.run_in_executor(executor, writer)
+        except Exception as error:
+            self.failures.append((path, error))
+        else:
+            self.written.append((path, time.perf_counter() - start))
+
+    def _submit(self, executor, path, writer):
+        future = asyncio.run_coroutine_threadsafe(self._write(executor, path, writer), self._loop)
+        self._pending.append(future)
+        return future
+
+    def submit(self, path, writer, *args, **kwargs):
+        """Queue a blocking writer ``writer(*args, **kwargs)`` producing ``path``"""
+        self._start()
+        return self._submit(self._writers, path, partial(writer, *args, **kwargs))
+
+    def write_csv(self, df, path, **kwargs):
+        """Queue ``df.to_csv(path, **kwargs)`` on a copy of the table"""
+        return self.submit(path, df.copy().to_csv, path, **kwargs)
+
+    def save_figure(self, fig, path, **kwargs):
+        """
+        Queue ``fig.savefig(path, **kwargs)``. The figure is closed in pyplot, so that later
+        pyplot calls draw on a new one, unless the backend is interactive (then it is saved now).
+        """
+        import matplotlib
+        import matplotlib.pyplot as plt
+
+        if matplotlib.get_backend().lower() not in NON_INTERACTIVE_BACKENDS:
+            fig.savefig(path, **kwargs)
+            self.written.append((path, 0.0))
+            return None
+        plt.close(fig)
+        self._start()
+        return self._submit(self._figures, path, partial(fig.savefig, path, **kwargs))
+
+    def wait(self):
+        """Block until every queued artifact is written; raise ExportError if any failed"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+        if self.failures:
+            failures, self.failures = self.failures, []
+            raise ExportError(failures)
+
+    def suspend(self):
+        """
+        wait() and stop the loop and writer threads, so that the process can fork safely;
+        the next export starts them again
+        """
+        try:
+            self.wait()
+        finally:
+            if self._loop is not None:
+                self._writers.shutdown()
+                self._figures.shutdown()
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._loop = None
+
+    def close(self):
+        self.suspend()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,197 @@
+from functools import cached_property
+from itertools import chain
+
+import numpy as np
+
+
+class FiberPacking:
+    """
+    Packing mode of the fiber allocation: instead of two new Fiber objects per circuit, every
+    link keeps a counted pool (EdgeFiberPool) that fills its fibers before lighting new ones.
+    Fibers are counted, not created, so the memory stays O(links) for any number of circuits.
+
+    :param wavelengths_per_fiber: Wavelengths of every fiber
+    :param fibers_per_cable: Fibers per cable, to report the cables to lay on each link
+    :param wavelength_capacity: Gbps of a wavelength; a circuit above it takes several
+                                wavelengths (None: one wavelength per circuit)
+    :param duplex: Fibers come in pairs, one per direction
+    """
+
+    def __init__(self, wavelengths_per_fiber=10, fibers_per_cable=12, wavelength_capacity=None, duplex=True):
+        if wavelengths_per_fiber < 1 or fibers_per_cable < 1:
+            raise ValueError("wavelengths_per_fiber and fibers_per_cable must be at least 1")
+        self.wavelengths_per_fiber = wavelengths_per_fiber
+        self.fibers_per_cable = fibers_per_cable
+        self.wavelength_capacity = wavelength_capacity
+        self.duplex = duplex
+
+    def wavelengths_for(self, capacity):
+        if self.wavelength_capacity is None:
+            return 1
+        return max(1, -(-capacity // self.wavelength_capacity))
+
+    def allocate(self, T, path, capacities):
+        """Add the circuits of ``capacities`` Gbps to the pools of every link of ``path``"""
+        wavelengths = sum(int(self.wavelengths_for(capacity)) for capacity in capacities)
+        gbps = sum(capacities)
+        for u, v in zip(path, path[1:]):
+            data = T.edges[u, v]
+            pool = data.get('fiber_pool')
+            if pool is None:
+                pool = data['fiber_pool'] = EdgeFiberPool(self)
+            pool.occupied_wavelengths += wavelengths
+            pool.gbps += gbps
+
+
+class EdgeFiberPool:
+    """Packed fibers of one link: occupied wavelengths and carried Gbps, fibers and cables derived"""
+    __slots__ = ('packing', 'occupied_wavelengths', 'gbps')
+
+    def __init__(self, packing):
+        self.packing = packing
+        self.occupied_wavelengths = 0
+        self.gbps = 0.0
+
+    @property
+    def directions(self):
+        return 2 if self.packing.duplex else 1
+
+    @property
+    def lit_fibers(self):
+        # Fibre per direzione, riempite una dopo l'altra
+        return -(-self.occupied_wavelengths // self.packing.wavelengths_per_fiber)
+
+    @property
+    def fibers(self):
+        return self.lit_fibers * self.directions
+
+    @property
+    def cables(self):
+        return -(-self.fibers // self.packing.fibers_per_cable)
+
+    def occupancy_histogram(self):
+        """Fibers with 0 ... wavelengths_per_fiber occupied wavelengths"""
+        per_fiber = self.packing.wavelengths_per_fiber
+        histogram = np.zeros(per_fiber + 1, dtype=int)
+        full, partial = divmod(self.occupied_wavelengths, per_fiber)
+        histogram[per_fiber] += full
+        histogram[partial] += 1 if partial else 0
+        return histogram * self.directions
+
+
+class FiberPlant:
+    """
+    Fiber plant of a dimensioned graph as contiguous arrays indexed by edge id.
+
+    The graph is read once: the number of fibers and the distance of every edge, and
+    (lazily, the first time they are needed) the capacity of every wavelength of every
+    fiber in one flat array. Link-level figures (occupied fibers and wavelengths, carried
+    Gbps, utilization) and plant-level ones (fiber-km, occupancy histogram) are then
+    reductions over those arrays. Links in packing mode add the counts of their
+    EdgeFiberPool; the fiber-level arrays only cover the fiber objects.
+
+    :param T: Graph whose edges may carry a 'fibers' list, a 'fiber_pool' and a 'distance' (or 'weight')
+    """
+
+    def __init__(self, T):
+        self.edges = list(T.edges())
+        self.edge_id = {}
+        for edge_id, (u, v) in enumerate(self.edges):
+            self.edge_id[(u, v)] = self.edge_id[(v, u)] = edge_id
+
+        attributes = [T.edges[u, v] for u, v in self.edges]
+        self._fiber_lists = [data.get('fibers') for data in attributes]
+        self._pools = [(edge_id, data['fiber_pool']) for edge_id, data in enumerate(attributes) if 'fiber_pool' in data]
+        self.has_fibers = np.array([fibers is not None for fibers in self._fiber_lists], dtype=bool)
+        self.object_fibers = np.array([len(fibers) if fibers else 0 for fibers in self._fiber_lists], dtype=int)
+        self.fibers = self.object_fibers + self._pool_values(lambda pool: pool.fibers, int)
+        self.cables = self._pool_values(lambda pool: pool.cables, int)
+        self.distance = np.array([data.get('distance', data.get('weight', 0.0)) for data in attributes], dtype=float)
+        if self._pools:
+            self.has_fibers[[edge_id for edge_id, _ in self._pools]] = True
+
+    def _pool_values(self, value, dtype):
+        values = np.zeros(len(self.edges), dtype=dtype)
+        for edge_id, pool in self._pools:
+            values[edge_id] = value(pool)
+        return values
+
+    def __len__(self):
+        return len(self.edges)
+
+    # Indici per fibra e per lunghezza d'onda, calcolati una volta sola
+
+    @cached_property
+    def fiber_edge(self):
+        """Edge id of every fiber object"""
+        return np.repeat(np.arange(len(self.edges)), self.object_fibers)
+
+    @cached_property
+    def _fiber_objects(self):
+        return [fiber for fibers in self._fiber_lists if fibers for fiber in fibers]
+
+    @cached_property
+    def fiber_wavelengths(self):
+        """Number of wavelengths of every fiber"""
+        fibers = self._fiber_objects
+        return np.fromiter((len(fiber.wavelengths) for fiber in fibers), dtype=int, count=len(fibers))
+
+    @cached_property
+    def wavelength_capacity(self):
+        """Capacity (Gbps) of every wavelength of every fiber, fiber after fiber"""
+        return np.fromiter(chain.from_iterable(fiber.wavelengths.values() for fiber in self._fiber_objects),
+                           dtype=float, count=int(self.fiber_wavelengths.sum()))
+
+    @cached_property
+    def fiber_occupancy(self):
+        """Occupied wavelengths of every fiber"""
+        wavelength_fiber = np.repeat(np.arange(len(self.fiber_wavelengths)), self.fiber_wavelengths)
+        return np.bincount(wavelength_fiber, weights=self.wavelength_capacity > 0,
+                           minlength=len(self.fiber_wavelengths)).astype(int)
+
+    # Grandezze per link
+
+    @cached_property
+    def occupied_wavelengths(self):
+        return (np.bincount(self.fiber_edge, weights=self.fiber_occupancy, minlength=len(self.edges)).astype(int)
+                + self._pool_values(lambda pool: pool.occupied_wavelengths * pool.directions, int))
+
+    @cached_property
+    def occupied_fibers(self):
+        return (np.bincount(self.fiber_edge, weights=self.fiber_occupancy > 0, minlength=len(self.edges)).astype(int)
+                + self._pool_values(lambda pool: pool.fibers, int))
+
+    @cached_property
+    def gbps(self):
+        """Capacity carried by every link, sum of its occupied wavelengths"""
+        wavelength_edge = np.repeat(self.fiber_edge, self.fiber_wavelengths)
+        return (np.bincount(wavelength_edge, weights=np.maximum(self.wavelength_capacity, 0), minlength=len(self.edges))
+                + self._pool_values(lambda pool: pool.gbps * pool.directions, float))
+
+    @cached_property
+    def wavelengths(self):
+        """Wavelengths available on every link"""
+        return (np.bincount(self.fiber_edge, weights=self.fiber_wavelengths, minlength=len(self.edges)).astype(int)
+                + self._pool_values(lambda pool: pool.fibers * pool.packing.wavelengths_per_fiber, int))
+
+    def utilization(self):
+        """Occupied fraction of the wavelengths of every link (0 where the link has none)"""
+        return np.divide(self.occupied_wavelengths, self.wavelengths, out=np.zeros(len(self.edges)),
+                         where=self.wavelengths > 0)
+
+    # Grandezze di impianto
+
+    def fiber_km(self):
+        return float(self.fibers @ self.distance)
+
+    def occupancy_histogram(self):
+        """Number of fibers with 0, 1, 2, ... occupied wavelengths"""
+        histograms = [np.bincount(self.fiber_occupancy)] + [pool.occupancy_histogram() for _, pool in self._pools]
+        histogram = np.zeros(max(len(h) for h in histograms), dtype=int)
+        for h in histograms:
+            histogram[:len(h)] += h
+        return histogram
+
+    def per_edge(self, values):
+        """Dict (u, v) -> value of a per-edge array"""
+        return dict(zip(self.edges, np.asarray(values).tolist()))
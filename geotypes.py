@@ -1,5 +1,5 @@
-import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 def create_dense_urban_geotype():
     # Definition of nodes with type and coordinates
@@ -326,7 +326,71 @@ def create_rural_geotype():
 
     return T, T_m
 
+
+def create_synthetic_geotype(num_sites, side=10.0, macro_share=0.15, seed=None):
+    """
+    Città sintetica per i test di scala: num_sites siti sparsi in un quadrato di lato
+    ``side`` km attorno alla root, collegati da un albero in cui ogni sito si aggancia al
+    sito più vicino (distanza Manhattan) tra quelli già collegati, più vicini alla root.
+    La ricerca usa una griglia di celle, quindi il costo è lineare nel numero di siti.
+
+    Ritorna (T, T_m, A) come create_geotype; le posizioni sono in metri.
+    """
+    rng = np.random.default_rng(seed)
+    half = side * 1000 / 2
+    points = rng.uniform(-half, half, size=(num_sites, 2))
+    points[0] = (0, 0)  # Root node
+    types = np.where(rng.random(num_sites) < macro_share, 1, 2)
+    types[0] = 0
+
+    cell = 2 * half / max(1, int(np.sqrt(num_sites)))
+    grid = {}
+    T = nx.Graph()
+    for i in np.argsort(np.abs(points).sum(axis=1), kind='stable'):
+        i = int(i)
+        position = (float(points[i, 0]), float(points[i, 1]))
+        T.add_node(i, type=int(types[i]), position=position, id=i)
+        cx, cy = int((points[i, 0] + half) // cell), int((points[i, 1] + half) // cell)
+
+        nearest, best, ring = None, np.inf, 0
+        # Allarga gli anelli di celle finché il più vicino trovato non può essere battuto
+        while grid and ring * cell <= best + cell:
+            for gx in range(cx - ring, cx + ring + 1):
+                for gy in range(cy - ring, cy + ring + 1):
+                    if max(abs(gx - cx), abs(gy - cy)) != ring:
+                        continue
+                    for j in grid.get((gx, gy), ()):
+                        distance = np.abs(points[i] - points[j]).sum()
+                        if distance < best:
+                            nearest, best = j, distance
+            ring += 1
+        if nearest is not None:
+            T.add_edge(i, nearest, weight=float(best))
+        grid.setdefault((cx, cy), []).append(i)
+
+    return T, add_corner_nodes(T), side * side
+
+
+def add_corner_nodes(T):
+    """Copia di T in cui ogni arco diagonale passa per un nodo corner (type 4), come T_m dei geotipi"""
+    T_m = T.copy()
+    next_id = max(T_m.nodes) + 1
+    for (u, v) in list(T_m.edges()):
+        pos_u = T_m.nodes[u]['position']
+        pos_v = T_m.nodes[v]['position']
+        if pos_u[0] != pos_v[0] and pos_u[1] != pos_v[1]:
+            corner = (pos_u[0], pos_v[1])
+            T_m.add_node(next_id, type=4, position=corner, id=next_id)
+            T_m.add_edge(u, next_id, weight=abs(pos_u[1] - pos_v[1]))
+            T_m.add_edge(next_id, v, weight=abs(pos_u[0] - pos_v[0]))
+            T_m.remove_edge(u, v)
+            next_id += 1
+    return T_m
+
+
 def plot_graph(T, title="Graph"):
+    import matplotlib.pyplot as plt
+
     # Insieme per tenere traccia delle etichette già utilizzate
     used_labels = set()
 
@@ -0,0 +1,151 @@
+"""
+Golden-result regression harness.
+
+Snapshots every (solution, case, alpha, term, scenario) result of the current model (costs,
+energy, switch and fiber counts) into a versioned golden file and checks new runs against it.
+Every solution is dimensioned once per (scenario, term), in forked workers, and then priced
+under each XR case and alpha, so the full grid runs in a few seconds.
+
+    python golden.py snapshot [--golden golden/golden_v12.json]
+    python golden.py check [--golden ...] [--rtol 1e-9] [--atol 1e-9] [--report diff.csv]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+from model_versions import MODEL_VERSIONS, dimension_once, version_rows
+
+GOLDEN_FORMAT = 1
+GOLDEN_VERSION = 'v12'
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden', f'golden_{GOLDEN_VERSION}.json')
+
+GOLDEN_TERMS = ['Medium', 'Long']
+GOLDEN_SCENARIOS = ['Dense Urban', 'Urban', 'Suburban', 'Rural']
+GOLDEN_ALPHA_VALUES = [0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 2.5, 3.0]
+
+KEYS = ['Solution', 'Case', 'Alpha', 'Term', 'Scenario']
+COST_METRICS = ['Total Cost', 'Normalized Cost', 'TX Cost', 'MUX Cost', 'Total Energy', 'TX Energy', 'SW Energy']
+COUNT_METRICS = ['SWITCH_SMALL', 'SWITCH_MEDIUM', 'SWITCH_BIG', 'SWITCH_EXTRA_LARGE', 'Fibers']
+
+# Conteggi esatti; costi ed energia con le tolleranze passate a compare_results
+EXACT = {metric: (0.0, 0.0) for metric in COUNT_METRICS}
+
+
+def collect_results(version=GOLDEN_VERSION, temporal_scenarios=GOLDEN_TERMS, deployment_scenarios=GOLDEN_SCENARIOS,
+                    alpha_values=GOLDEN_ALPHA_VALUES, max_workers=None):
+    """
+    Results of the model over the golden grid.
+
+    :return: Dict key tuple (Solution, Case, Alpha, Term, Scenario) -> dict metric -> value
+    """
+    networks = dimension_once(temporal_scenarios, deployment_scenarios, max_workers=max_workers,
+                              options=MODEL_VERSIONS[version].dimensioning)
+    results = {}
+    for key, metrics in version_rows(MODEL_VERSIONS[version], networks, alpha_values):
+        name, case, alpha, term, scenario = key
+        network = networks[(name, scenario, term)]
+        metrics.update({switch: sum(count for eq_enum, count in network['counts'].items() if eq_enum.name == switch)
+                        for switch in COUNT_METRICS[:-1]})
+        metrics['Fibers'] = network['fibers']
+        results[key] = metrics
+    return results
+
+
+def save_golden(results, path=GOLDEN_PATH, version=GOLDEN_VERSION):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    metrics = COST_METRICS + COUNT_METRICS
+    header = {'format': GOLDEN_FORMAT, 'model_version': version, 'keys': KEYS, 'metrics': metrics}
+    rows = [json.dumps(list(key) + [values[metric] for metric in metrics]) for key, values in results.items()]
+    # Una riga per risultato, così i diff del file golden restano leggibili
+    with open(path, 'w') as f:
+        f.write(json.dumps(header, indent=1)[:-2] + ',\n "rows": [\n  ' + ',\n  '.join(rows) + '\n ]\n}\n')
+
+
+def load_golden(path=GOLDEN_PATH):
+    with open(path) as f:
+        golden = json.load(f)
+    if golden['format'] != GOLDEN_FORMAT:
+        raise ValueError(f"Golden file format {golden['format']} not supported (expected {GOLDEN_FORMAT})")
+
+    n_keys = len(golden['keys'])
+    results = {}
+    for row in golden['rows']:
+        results[tuple(row[:n_keys])] = dict(zip(golden['metrics'], row[n_keys:]))
+    return golden['model_version'], results
+
+
+def compare_results(golden, current, rtol=1e-9, atol=1e-9, metric_tolerances=EXACT):
+    """
+    Differences between two result dicts (see collect_results).
+
+    :param metric_tolerances: Dict metric -> (rtol, atol) overriding the defaults
+    :return: List of dicts with the key, Metric, Golden and Current values (None where the row
+             or metric is missing), Abs Diff and Rel Diff
+    """
+    diffs = []
+    for key in list(golden) + [key for key in current if key not in golden]:
+        expected, actual = golden.get(key), current.get(key)
+        for metric in (expected or actual):
+            golden_value = expected.get(metric) if expected is not None else None
+            current_value = actual.get(metric) if actual is not None else None
+            if golden_value is None or current_value is None:
+                abs_diff = rel_diff = None
+            else:
+                metric_rtol, metric_atol = metric_tolerances.get(metric, (rtol, atol))
+                if math.isclose(current_value, golden_value, rel_tol=metric_rtol, abs_tol=metric_atol):
+                    continue
+                abs_diff = current_value - golden_value
+                rel_diff = abs_diff / golden_value if golden_value else math.inf
+
+            diff = dict(zip(KEYS, key))
+            diff.update({'Metric': metric, 'Golden': golden_value, 'Current': current_value,
+                         'Abs Diff': abs_diff, 'Rel Diff': rel_diff})
+            diffs.append(diff)
+    return diffs
+
+
+def format_diff_report(diffs, limit=50):
+    if not diffs:
+        return "No differences."
+    lines = [f"{len(diffs)} differences:"]
+    for diff in diffs[:limit]:
+        label = ' / '.join(str(diff[key]) for key in KEYS if diff[key] is not None)
+        lines.append(f"  {label:<50} {diff['Metric']:<20} golden={diff['Golden']!s:<22} "
+                     f"current={diff['Current']!s:<22} rel={diff['Rel Diff']}")
+    if len(diffs) > limit:
+        lines.append(f"  ... {len(diffs) - limit} more")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=['snapshot', 'check'])
+    parser.add_argument('--golden', default=GOLDEN_PATH)
+    parser.add_argument('--rtol', type=float, default=1e-9)
+    parser.add_argument('--atol', type=float, default=1e-9)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--report', help="Write the differences to this CSV file")
+    args = parser.parse_args(argv)
+
+    current = collect_results(max_workers=args.workers)
+    if args.command == 'snapshot':
+        save_golden(current, args.golden)
+        print(f"Saved {len(current)} results to '{args.golden}'")
+        return 0
+
+    version, golden = load_golden(args.golden)
+    if version != GOLDEN_VERSION:
+        print(f"Warning: golden file is for model {version}, current model is {GOLDEN_VERSION}")
+    diffs = compare_results(golden, current, args.rtol, args.atol)
+    print(format_diff_report(diffs))
+    if args.report:
+        import pandas as pd
+        pd.DataFrame(diffs, columns=KEYS + ['Metric', 'Golden', 'Current', 'Abs Diff', 'Rel Diff']).to_csv(
+            args.report, index=False)
+    return 1 if diffs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
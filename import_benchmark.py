@@ -0,0 +1,83 @@
+"""
+Import-time benchmark of the engine modules.
+
+Every run imports the modules in a fresh interpreter (the way a pool worker or a short
+CLI call would) and checks that no plotting/reporting library gets loaded along the way.
+The budget applies to the time on top of numpy + networkx, which the engine cannot avoid.
+
+    python import_benchmark.py [--runs 5] [--budget-ms 100] [module ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+CORE_MODULES = ['engine', 'model_versions', 'fiber_plant', 'wavelength_assignment', 'geotypes', 'result_cube',
+                'metro', 'price_grid', 'job_queue', 'sensitivity', 'pareto',
+                'traffic_profile', 'exports', 'result_table']
+
+# Librerie che il motore non deve mai caricare all'import
+PLOTTING_MODULES = ['matplotlib', 'pandas', 'seaborn', 'reportlab', 'fpdf']
+
+# Dipendenze di terze parti del motore, riportate a parte
+ENGINE_DEPENDENCIES = ['numpy', 'networkx']
+
+# I moduli si importano dalla cartella del repository, da qualunque cartella si lanci lo script
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+loaded = [name for name in {plotting!r} if name in sys.modules]
+print(elapsed)
+print(','.join(loaded))
+"""
+
+
+def measure_import(modules, runs=5):
+    """
+    Best-of-``runs`` wall time (s) to import ``modules`` in a fresh interpreter.
+
+    :return: (seconds, list of plotting modules found in sys.modules afterwards)
+    """
+    code = _PROBE.format(modules=list(modules), plotting=PLOTTING_MODULES)
+    best, loaded = float('inf'), []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True,
+                                cwd=REPO_DIR).stdout
+        elapsed, plotting = output.splitlines()
+        best = min(best, float(elapsed))
+        loaded = [name for name in plotting.split(',') if name]
+    return best, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=CORE_MODULES)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    dependencies, _ = measure_import(ENGINE_DEPENDENCIES, args.runs)
+    total, loaded = measure_import(args.modules, args.runs)
+
+    print(f"{'numpy + networkx':<24}{dependencies * 1000:8.1f} ms")
+    engine = max(total - dependencies, 0)
+    print(f"{'engine modules':<24}{engine * 1000:8.1f} ms  (budget {args.budget_ms:.0f} ms)")
+    print(f"{'total':<24}{total * 1000:8.1f} ms")
+
+    failed = False
+    if loaded:
+        print(f"FAIL: plotting/reporting modules imported: {', '.join(loaded)}")
+        failed = True
+    if engine * 1000 > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
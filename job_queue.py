@@ -0,0 +1,393 @@
+"""
+Local distributed job queue for sweeps that exceed one machine.
+
+Grid points are serialised as JSON jobs into a SQLite file that every worker opens (on a
+shared filesystem for several hosts, no external service). Workers lease jobs, evaluate them
+with the engine and store the results in the same file. A lease expires if its worker stops
+renewing it, so the job of a crashed worker goes back to the queue and is retried, up to
+max_attempts; completing a job requires holding its lease, so a late worker cannot overwrite
+the result of the retry.
+
+    python job_queue.py submit sweep.db --terms Medium Long
+    python job_queue.py work sweep.db          # on every host, as many times as there are cores
+    python job_queue.py status sweep.db
+    python job_queue.py check                   # a job outlives many short leases unstolen
+
+    networks = collect_networks(JobQueue('sweep.db'))   # same layout as dimension_once
+
+SQLite locking needs a filesystem with working POSIX locks (a local disk, NFSv4, Lustre...);
+lease deadlines use the wall clock, so the hosts must keep their clocks in sync.
+"""
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+from engine import NetworkEquipmentTypeEnum, SOLUTION_REGISTRY, measure_cost_and_energy
+
+JOB_PENDING = 'pending'
+JOB_LEASED = 'leased'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_until);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    worker TEXT,
+    finished REAL
+);
+"""
+
+
+class JobQueue:
+    """
+    Job queue and result store in one SQLite file.
+
+    :param path: Database file, created if missing
+    :param lease_seconds: A leased job not renewed for this long is handed to another worker
+    :param max_attempts: Leases per job before it is marked failed
+    """
+
+    def __init__(self, path, lease_seconds=600.0, max_attempts=3, timeout=60.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # Transazioni esplicite (BEGIN IMMEDIATE) per prendere il lock di scrittura subito
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def _transaction(self):
+        return _Transaction(self.connection)
+
+    def submit(self, jobs):
+        """
+        Add jobs, skipping the keys already in the queue (a sweep can be resubmitted).
+
+        :param jobs: Iterable of (key, kind, payload) with a JSON-serialisable payload
+        :return: Number of jobs added
+        """
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany("INSERT OR IGNORE INTO jobs (key, kind, payload) VALUES (?, ?, ?)",
+                           [(key, kind, json.dumps(payload)) for key, kind, payload in jobs])
+            return db.total_changes - before
+
+    def lease(self, worker):
+        """
+        Lease the next pending job, or one whose lease has expired.
+
+        :return: (id, key, kind, payload) or None when no job is available
+        """
+        now = time.time()
+        with self._transaction() as db:
+            # Lease scaduti oltre il numero massimo di tentativi: il job è fallito
+            db.execute("UPDATE jobs SET status = ?, error = COALESCE(error, 'lease expired') "
+                       "WHERE status = ? AND lease_until < ? AND attempts >= ?",
+                       (JOB_FAILED, JOB_LEASED, now, self.max_attempts))
+            row = db.execute("SELECT id, key, kind, payload FROM jobs "
+                             "WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY id LIMIT 1",
+                             (JOB_PENDING, JOB_LEASED, now)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE jobs SET status = ?, attempts = attempts + 1, worker = ?, lease_until = ? "
+                       "WHERE id = ?", (JOB_LEASED, worker, now + self.lease_seconds, row[0]))
+        job_id, key, kind, payload = row
+        return job_id, key, kind, json.loads(payload)
+
+    def renew(self, job_id, worker):
+        """Extend the lease of a running job; False if the worker no longer holds it"""
+        with self._transaction() as db:
+            cursor = db.execute("UPDATE jobs SET lease_until = ? WHERE id = ? AND status = ? AND worker = ?",
+                                (time.time() + self.lease_seconds, job_id, JOB_LEASED, worker))
+            return cursor.rowcount == 1
+
+    def complete(self, job_id, worker, result):
+        """Store the result of a leased job; False (result dropped) if the lease was lost"""
+        with self._transaction() as db:
+            cursor = db.execute("UPDATE jobs SET status = ?, lease_until = NULL, error = NULL "
+                                "WHERE id = ? AND status = ? AND worker = ?", (JOB_DONE, job_id, JOB_LEASED, worker))
+            if cursor.rowcount != 1:
+                return False
+            db.execute("INSERT OR REPLACE INTO results (key, result, worker, finished) "
+                       "SELECT key, ?, ?, ? FROM jobs WHERE id = ?", (json.dumps(result), worker, time.time(), job_id))
+            return True
+
+    def fail(self, job_id, worker, error):
+        """Release a leased job after an error: back to pending, or failed after max_attempts"""
+        with self._transaction() as db:
+            db.execute("UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                       "lease_until = NULL, error = ? WHERE id = ? AND status = ? AND worker = ?",
+                       (self.max_attempts, JOB_FAILED, JOB_PENDING, error, job_id, JOB_LEASED, worker))
+
+    def retry_failed(self):
+        """Put the failed jobs back in the queue with a fresh attempt count"""
+        with self._transaction() as db:
+            return db.execute("UPDATE jobs SET status = ?, attempts = 0 WHERE status = ?",
+                              (JOB_PENDING, JOB_FAILED)).rowcount
+
+    def counts(self):
+        """Dict status -> number of jobs"""
+        counts = dict.fromkeys([JOB_PENDING, JOB_LEASED, JOB_DONE, JOB_FAILED], 0)
+        counts.update(self.connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return counts
+
+    def failures(self):
+        return self.connection.execute("SELECT key, attempts, error FROM jobs WHERE status = ?",
+                                       (JOB_FAILED,)).fetchall()
+
+    def results(self, kind=None):
+        """Dict key -> result of the completed jobs (of one kind)"""
+        query = "SELECT r.key, r.result FROM results r JOIN jobs j ON j.key = r.key"
+        rows = self.connection.execute(query + " WHERE j.kind = ?", (kind,)) if kind else \
+            self.connection.execute(query)
+        return {key: json.loads(result) for key, result in rows}
+
+
+class _Transaction:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc, tb):
+        self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+# ============================================
+# JOB DEL MODELLO
+# ============================================
+
+def _names(values):
+    # Chiavi enum -> nomi, per il JSON
+    return {eq_enum.name: value for eq_enum, value in values.items() if value}
+
+
+def _enums(values):
+    counts = dict.fromkeys(NetworkEquipmentTypeEnum, 0)
+    counts.update({NetworkEquipmentTypeEnum[name]: value for name, value in values.items()})
+    return counts
+
+
+def run_dimension_job(scenario, term, names=None):
+    """Dimension the solutions on one (scenario, term), as model_versions.dimension_once does"""
+    from model_versions import _dimension_pair
+
+    return [{'solution': solution, 'scenario': scenario, 'term': term,
+             'counts': _names(network['counts']), 'energy_bom': _names(network['energy_bom']),
+             'switching_mwh': network['switching_mwh'], 'fibers': network['fibers'], 'area': network['area']}
+            for (solution, scenario, term), network in _dimension_pair(scenario, term, names).items()]
+
+
+def run_evaluate_job(solution, scenario, term, case=None, alpha=None, version='v12'):
+    """Costs and energy of one grid point, dimensioned under the revision's catalog"""
+    from model_versions import MODEL_VERSIONS
+
+    with MODEL_VERSIONS[version].catalog(case, alpha):
+        T, A = SOLUTION_REGISTRY[solution].evaluate(scenario, term)
+        metrics = measure_cost_and_energy(T)
+    metrics['Normalized Cost'] = metrics['Total Cost'] / A
+    return metrics
+
+
+JOB_KINDS = {
+    'dimension': run_dimension_job,
+    'evaluate': run_evaluate_job,
+}
+
+
+def dimension_jobs(temporal_scenarios, deployment_scenarios, names=None):
+    """One 'dimension' job per (scenario, term)"""
+    return [(f'dimension/{scenario}/{term}', 'dimension', {'scenario': scenario, 'term': term, 'names': names})
+            for term in temporal_scenarios for scenario in deployment_scenarios]
+
+
+def evaluate_jobs(grid, version='v12'):
+    """
+    One 'evaluate' job per grid point.
+
+    :param grid: Iterable of (solution, scenario, term, case, alpha)
+    """
+    return [(f'evaluate/{version}/{solution}/{scenario}/{term}/{case}/{alpha}', 'evaluate',
+             {'solution': solution, 'scenario': scenario, 'term': term, 'case': case, 'alpha': alpha,
+              'version': version})
+            for solution, scenario, term, case, alpha in grid]
+
+
+def collect_networks(queue):
+    """Results of the 'dimension' jobs as model_versions.dimension_once returns them"""
+    networks = {}
+    for result in queue.results('dimension').values():
+        for network in result:
+            networks[(network['solution'], network['scenario'], network['term'])] = {
+                'counts': _enums(network['counts']), 'energy_bom': _enums(network['energy_bom']),
+                'switching_mwh': network['switching_mwh'], 'fibers': network['fibers'], 'area': network['area']
+            }
+    return networks
+
+
+# ============================================
+# WORKER
+# ============================================
+
+def _keep_leased(path, job_id, worker, lease_seconds, stop):
+    # Rinnova il lease mentre il job gira (connessione propria: sqlite è per thread),
+    # con la stessa durata del worker e tre rinnovi per lease
+    queue = JobQueue(path, lease_seconds)
+    try:
+        while not stop.wait(lease_seconds / 3):
+            if not queue.renew(job_id, worker):
+                break
+    finally:
+        queue.close()
+
+
+def run_worker(path, worker=None, lease_seconds=600.0, max_attempts=3, poll=5.0, exit_when_idle=True,
+               job_kinds=JOB_KINDS):
+    """
+    Lease and run jobs until the queue is drained.
+
+    :param worker: Worker id stored with the lease (default host:pid)
+    :param poll: Seconds to wait before asking again when no job is available but some are leased
+    :param exit_when_idle: Return when no job is pending or leased (else keep polling)
+    :return: Number of jobs completed by this worker
+    """
+    worker = worker or f'{socket.gethostname()}:{os.getpid()}'
+    queue = JobQueue(path, lease_seconds, max_attempts)
+    completed = 0
+    try:
+        while True:
+            job = queue.lease(worker)
+            if job is None:
+                counts = queue.counts()
+                if exit_when_idle and counts[JOB_PENDING] == counts[JOB_LEASED] == 0:
+                    return completed
+                time.sleep(poll)
+                continue
+
+            job_id, key, kind, payload = job
+            stop = threading.Event()
+            keeper = threading.Thread(target=_keep_leased, args=(path, job_id, worker, lease_seconds, stop),
+                                      daemon=True)
+            keeper.start()
+            try:
+                result = job_kinds[kind](**payload)
+            except Exception as error:
+                stop.set()
+                keeper.join()
+                queue.fail(job_id, worker, f'{type(error).__name__}: {error}')
+                print(f"[{worker}] {key} failed: {error}")
+                continue
+            stop.set()
+            keeper.join()
+            if queue.complete(job_id, worker, result):
+                completed += 1
+                print(f"[{worker}] {key} done")
+            else:
+                print(f"[{worker}] {key} lost its lease, result dropped")
+    finally:
+        queue.close()
+
+
+def check_lease_renewal(lease_seconds=0.6, leases=5):
+    """
+    Run one job lasting ``leases`` leases on a fresh queue in a temporary directory, while
+    another worker keeps trying to lease it: the renewals must keep the job with its worker
+    and never push the deadline beyond one lease.
+
+    :return: List of problems found (empty if the renewal works)
+    """
+    problems = []
+
+    def probe(path, seconds):
+        thief = JobQueue(path, lease_seconds)
+        try:
+            end = time.time() + seconds
+            while time.time() < end:
+                (lease_until,) = thief.connection.execute("SELECT lease_until FROM jobs").fetchone()
+                if lease_until - time.time() > lease_seconds * 1.05:
+                    problems.append(f"lease renewed for more than {lease_seconds} s")
+                if thief.lease('thief') is not None:
+                    problems.append("running job leased by another worker")
+                time.sleep(lease_seconds / 10)
+        finally:
+            thief.close()
+        return {}
+
+    with tempfile.TemporaryDirectory(prefix='job_queue_check_') as directory:
+        path = os.path.join(directory, 'check.db')
+        queue = JobQueue(path, lease_seconds)
+        try:
+            queue.submit([('lease-check', 'probe', {'path': path, 'seconds': leases * lease_seconds})])
+        finally:
+            queue.close()
+        if run_worker(path, worker='check', lease_seconds=lease_seconds, job_kinds={'probe': probe}) != 1:
+            problems.append("job not completed by its worker")
+    return sorted(set(problems))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=['submit', 'work', 'status', 'retry', 'check'])
+    parser.add_argument('path', nargs='?', help='Queue database (not used by check)')
+    parser.add_argument('--terms', nargs='+', default=['Medium', 'Long'])
+    parser.add_argument('--scenarios', nargs='+', default=['Dense Urban', 'Urban', 'Suburban', 'Rural'])
+    parser.add_argument('--solutions', nargs='+', default=None)
+    parser.add_argument('--lease', type=float, default=None, help='Lease seconds (default 600, 0.6 for check)')
+    parser.add_argument('--max-attempts', type=int, default=3)
+    args = parser.parse_args(argv)
+    if args.path is None and args.command != 'check':
+        parser.error(f"{args.command} needs the queue path")
+    if args.lease is None:
+        args.lease = 0.6 if args.command == 'check' else 600.0
+
+    if args.command == 'work':
+        completed = run_worker(args.path, lease_seconds=args.lease, max_attempts=args.max_attempts)
+        print(f"{completed} jobs completed")
+        return 0
+    if args.command == 'check':
+        problems = check_lease_renewal(args.lease)
+        print('\n'.join(problems) or "Lease renewal OK.")
+        return 1 if problems else 0
+
+    queue = JobQueue(args.path, args.lease, args.max_attempts)
+    try:
+        if args.command == 'submit':
+            added = queue.submit(dimension_jobs(args.terms, args.scenarios, args.solutions))
+            print(f"{added} jobs submitted to '{args.path}'")
+        elif args.command == 'retry':
+            print(f"{queue.retry_failed()} failed jobs back in the queue")
+        counts = queue.counts()
+        print(', '.join(f'{status}: {count}' for status, count in counts.items()))
+        for key, attempts, error in queue.failures():
+            print(f"  {key} ({attempts} attempts): {error}")
+        return 1 if counts[JOB_FAILED] else 0
+    finally:
+        queue.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
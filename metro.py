@@ -0,0 +1,159 @@
+"""
+Multi-hub metro model.
+
+A city topology is served by several hubs (central offices): every site is assigned to the
+hub it reaches along the shortest tree path, each catchment is dimensioned on its own with
+its hub as root, in forked workers, and the per-hub bills of materials and power are merged.
+The catchments are independent, so a whole city costs one catchment per hub and worker.
+A hub may be a radio site: its catchment then gets a central office co-located with it, at
+0 m, and the site is dimensioned as a local node like every other one.
+
+    T, T_m, A = create_synthetic_geotype(20000, side=20.0, seed=1)
+    deploy_radio_equipment(T, 'Long', 'Urban')
+    metro = evaluate_metro(T, 'P2MP', 'Long', hubs=[0, 5000, 10000, 15000])
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+
+from engine import (
+    NetworkEquipmentTypeEnum,
+    network_equipment_types,
+    SOLUTION_REGISTRY,
+    TX_COMPONENTS,
+    SWITCHING_COMPONENTS,
+    dimensioned_nodes,
+    node_radio_demand,
+    total_radio_demand,
+)
+from fiber_plant import FiberPlant
+from sensitivity import ANNUAL_MWH_PER_W, cost_gradient
+
+EVERY_COMPONENT = [eq_enum.name for eq_enum in NetworkEquipmentTypeEnum]
+
+_metro_graph = None
+
+
+def hub_catchments(T, hubs):
+    """
+    Partition the nodes among the hubs by tree distance ('weight'), with one multi-source
+    Dijkstra. Every node is reached from its hub through nodes of the same catchment, so each
+    catchment is a connected subtree rooted at its hub.
+
+    :return: Dict hub -> list of nodes of its catchment (unreachable nodes are left out)
+    """
+    _, paths = nx.multi_source_dijkstra(T, set(hubs), weight='weight')
+    catchments = {hub: [] for hub in hubs}
+    for node, path in paths.items():
+        catchments[path[0]].append(node)
+    return catchments
+
+
+def catchment_graph(T, nodes, hub):
+    """
+    Copy of the catchment subgraph, without the root routes cached for the whole topology.
+    If the hub is a radio site (not type 0) a central office is added next to it, at 0 m, so
+    that the site keeps its own demand instead of being skipped as the root.
+
+    :return: (C, root node of C)
+    """
+    C = T.subgraph(nodes).copy()
+    C.graph.pop('root_routes', None)
+    if C.nodes[hub]['type'] == 0:
+        return C, hub
+    root = max(C.nodes) + 1
+    C.add_node(root, type=0, position=C.nodes[hub]['position'], id=root)
+    C.add_edge(root, hub, weight=0.0)
+    return C, root
+
+
+def _set_metro_graph(T):
+    global _metro_graph
+    _metro_graph = T
+
+
+def _evaluate_catchment(name, term, hub, nodes):
+    C, root = catchment_graph(_metro_graph, nodes, hub)
+    SOLUTION_REGISTRY[name].apply(C, term, root_node=root)
+    plant = FiberPlant(C)
+    return {
+        'Hub': hub,
+        'Sites': len(nodes),
+        'radio_gbps': float(node_radio_demand(C, term, dimensioned_nodes(C, root)).sum()),
+        'counts': cost_gradient(C, network_equipment_types, EVERY_COMPONENT),
+        'switching_w': sum(C.nodes[node]['switching_consumption'] for node in C.nodes()),
+        'other_w': sum(C.nodes[node]['other_consumption'] for node in C.nodes()),
+        'fibers': int(plant.fibers.sum()),
+        'fiber_km': plant.fiber_km() / 1000,
+    }
+
+
+def evaluate_catchments(T, name, term, hubs, max_workers=None):
+    """
+    Dimension every hub catchment of T with a registered solution, in forked workers where
+    fork is available. T must carry the radio deployment and no equipment yet.
+
+    :param max_workers: Pool size, 1 to run serially
+    :return: List of per-hub dicts with the Hub, the number of Sites, the served 'radio_gbps',
+             the equipment 'counts', 'switching_w' and 'other_w' (W), 'fibers' and 'fiber_km'
+    :raises ValueError: If the catchments do not serve the whole radio demand of T
+    """
+    catchments = [(hub, nodes) for hub, nodes in hub_catchments(T, hubs).items() if nodes]
+    n = len(catchments)
+    if max_workers == 1 or n < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        _set_metro_graph(T)
+        try:
+            results = [_evaluate_catchment(name, term, hub, nodes) for hub, nodes in catchments]
+        finally:
+            _set_metro_graph(None)
+    else:
+        hubs, nodes = zip(*catchments)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=_set_metro_graph, initargs=(T,)) as pool:
+            results = list(pool.map(_evaluate_catchment, [name] * n, [term] * n, hubs, nodes))
+
+    # Con uno o N hub la domanda radio servita deve essere la stessa: quella di tutta la città
+    served, demand = sum(result['radio_gbps'] for result in results), total_radio_demand(T, term)
+    if abs(served - demand) > 1e-6 * max(1.0, demand):
+        raise ValueError(f"Catchments serve {served:.3f} Gbps of the {demand:.3f} Gbps radio demand")
+    return results
+
+
+def merge_catchments(results):
+    """Sum the per-hub results of evaluate_catchments into the city totals"""
+    counts = {}
+    for result in results:
+        for eq_enum, count in result['counts'].items():
+            counts[eq_enum] = counts.get(eq_enum, 0) + count
+    return {
+        'Hubs': len(results),
+        'Sites': sum(result['Sites'] for result in results),
+        'radio_gbps': sum(result['radio_gbps'] for result in results),
+        'counts': counts,
+        'switching_w': sum(result['switching_w'] for result in results),
+        'other_w': sum(result['other_w'] for result in results),
+        'fibers': sum(result['fibers'] for result in results),
+        'fiber_km': sum(result['fiber_km'] for result in results),
+    }
+
+
+def metro_metrics(merged):
+    """Costs and annual energy (MWh) of merged results at the current catalog prices"""
+    def cost(components):
+        return sum(network_equipment_types[eq_enum].normalized_price * count
+                   for eq_enum, count in merged['counts'].items()
+                   if count and any(comp_type in eq_enum.name for comp_type in components))
+
+    tx_cost, switching_cost = cost(TX_COMPONENTS), cost(SWITCHING_COMPONENTS)
+    return {
+        'Hubs': merged['Hubs'], 'Sites': merged['Sites'], 'Radio Gbps': merged['radio_gbps'],
+        'Total Cost': tx_cost + switching_cost, 'TX Cost': tx_cost, 'Switching Cost': switching_cost,
+        'Total Energy': (merged['switching_w'] + merged['other_w']) * ANNUAL_MWH_PER_W,
+        'Fibers': merged['fibers'], 'Fiber km': merged['fiber_km'],
+    }
+
+
+def evaluate_metro(T, name, term, hubs, max_workers=None):
+    """Dimension a multi-hub city with a solution and return its metro_metrics"""
+    return metro_metrics(merge_catchments(evaluate_catchments(T, name, term, hubs, max_workers)))
@@ -0,0 +1,255 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from engine import (
+    NetworkEquipmentTypeEnum,
+    network_equipment_types,
+    reset_all_costs_to_original,
+    deploy_radio_equipment,
+    root_routes,
+    get_solutions,
+    SOLUTION_REGISTRY,
+    update_xr_costs_based_on_grey_lr,
+    update_xr_equipment_scenario,
+    TX_COMPONENTS,
+    SWITCHING_COMPONENTS,
+    XR_CASES,
+    GREY_LR_OPTICS,
+)
+from fiber_plant import FiberPlant
+from geotypes import create_geotype
+from sensitivity import ANNUAL_MWH_PER_W, tagged_max_power, cost_gradient, energy_gradient
+
+
+class ModelVersion:
+    """
+    A revision of the model (main_v9 ... main_v12) as a configuration of the shared engine.
+    The revisions differ in catalog prices, in how the cost is split between transmission and
+    switching, in how the XR equipment is priced and in a few dimensioning options (v9 - v11
+    use grey LR uplinks only in P2P).
+
+    :param price_overrides: Dict enum -> normalized_price replacing the engine catalog value
+    :param tx_components: Name fragments counted as transmission cost
+    :param switching_components: Name fragments counted as switching cost (total = TX + switching)
+    :param xr_cases: XR catalog cases of update_xr_equipment_scenario, or (None,) for the nominal catalog
+    :param alpha_pricing: The revision supports the XR = GREY LR × alpha price model
+    :param dimensioning: Dimensioning options passed to SolutionStrategy.apply (default: the engine ones)
+    """
+
+    def __init__(self, name, price_overrides=None, tx_components=TX_COMPONENTS,
+                 switching_components=SWITCHING_COMPONENTS, xr_cases=(None,), alpha_pricing=False,
+                 dimensioning=None):
+        self.name = name
+        self.price_overrides = dict(price_overrides or {})
+        self.tx_components = list(tx_components)
+        self.switching_components = list(switching_components)
+        self.xr_cases = tuple(xr_cases)
+        self.alpha_pricing = alpha_pricing
+        self.dimensioning = dict(dimensioning or {})
+
+    @contextmanager
+    def catalog(self, case=None, alpha=None):
+        """Temporarily set the engine catalog to this revision (and XR case or alpha), then reset it"""
+        reset_all_costs_to_original()
+        try:
+            for eq_enum, normalized_price in self.price_overrides.items():
+                network_equipment_types[eq_enum].normalized_price = normalized_price
+            if case is not None:
+                update_xr_equipment_scenario(network_equipment_types, NetworkEquipmentTypeEnum, case)
+            if alpha is not None:
+                update_xr_costs_based_on_grey_lr(network_equipment_types, NetworkEquipmentTypeEnum, alpha)
+            yield network_equipment_types
+        finally:
+            reset_all_costs_to_original()
+
+    def price_vectors(self, case=None, alpha=None):
+        """(normalized_price, max_power) of every catalog entry under this revision"""
+        with self.catalog(case, alpha) as catalog:
+            return ({eq_enum: spec.normalized_price for eq_enum, spec in catalog.items()},
+                    {eq_enum: spec.max_power for eq_enum, spec in catalog.items()})
+
+
+# v9/v10: switch prices before the ×4 update, media converters counted as switching
+# and SWITCH_BIG left out of the cost breakdown
+_V9_SWITCH_PRICES = {
+    NetworkEquipmentTypeEnum.SWITCH_SMALL: 0.60,
+    NetworkEquipmentTypeEnum.SWITCH_MEDIUM: 1.60,
+    NetworkEquipmentTypeEnum.SWITCH_BIG: 2.80,
+    NetworkEquipmentTypeEnum.SWITCH_EXTRA_LARGE: 2.80,
+}
+_V9_TX_COMPONENTS = ["GREY_TRANSCEIVERS", "WDM_TRANSCEIVERS", "XR_MODULE", "TRANSPONDER"]
+_V9_SWITCHING_COMPONENTS = ["SWITCH_SMALL", "SWITCH_MEDIUM", "SWITCH_EXTRA_LARGE", "WDM_MUX", "MEDIA_CONVERTER"]
+# v9 - v11: uplink P2P sempre grey LR, anche per i siti vicini alla root
+_LR_UPLINKS = {'uplink_optics': tuple(GREY_LR_OPTICS)}
+
+MODEL_VERSIONS = {
+    'v9': ModelVersion('v9', _V9_SWITCH_PRICES, _V9_TX_COMPONENTS, _V9_SWITCHING_COMPONENTS,
+                       dimensioning=_LR_UPLINKS),
+    'v10': ModelVersion('v10', _V9_SWITCH_PRICES, _V9_TX_COMPONENTS, _V9_SWITCHING_COMPONENTS,
+                        alpha_pricing=True, dimensioning=_LR_UPLINKS),
+    'v11': ModelVersion('v11', xr_cases=XR_CASES, alpha_pricing=True, dimensioning=_LR_UPLINKS),
+    'v12': ModelVersion('v12', xr_cases=XR_CASES, alpha_pricing=True),
+}
+
+
+def get_versions(names=None):
+    if names is None:
+        return list(MODEL_VERSIONS.values())
+    return [MODEL_VERSIONS[name] for name in names]
+
+
+def _dimension_pair(scenario, term, names=None, options=None):
+    # Una topologia per (scenario, term), copiata per ogni soluzione
+    networks = {}
+    every_component = [eq_enum.name for eq_enum in NetworkEquipmentTypeEnum]
+    T_base, T_m, A = create_geotype(scenario)
+    deploy_radio_equipment(T_base, term, scenario)
+    root_routes(T_base)  # Percorsi verso la root condivisi da tutte le copie
+    for strategy in get_solutions(names):
+        T = T_base.copy()
+        reset_all_costs_to_original()
+        with tagged_max_power(network_equipment_types):
+            strategy.apply(T, term, **(options or {}))
+        networks[(strategy.name, scenario, term)] = {
+            'counts': cost_gradient(T, network_equipment_types, every_component),
+            'energy_bom': energy_gradient(T, network_equipment_types),
+            'switching_mwh': sum(T.nodes[node]['switching_consumption'] for node in T.nodes()) * ANNUAL_MWH_PER_W,
+            'fibers': int(FiberPlant(T).fibers.sum()),
+            'area': A
+        }
+    return networks
+
+
+def dimension_once(temporal_scenarios, deployment_scenarios, names=None, max_workers=None, options=None):
+    """
+    Dimension every solution once per (scenario, term), on a copy of a topology built and
+    deployed once per (scenario, term), and keep only what the revisions need to price it.
+    The (scenario, term) pairs run in forked workers where fork is available.
+
+    :param max_workers: Pool size, 1 to run serially
+    :param options: Dimensioning options of a revision (ModelVersion.dimensioning)
+    :return: Dict (solution, scenario, term) -> dict with the equipment 'counts', the
+             'energy_bom', 'switching_mwh', the number of 'fibers' and the 'area'
+    """
+    pairs = [(scenario, term) for term in temporal_scenarios for scenario in deployment_scenarios]
+    if max_workers == 1 or len(pairs) < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        results = [_dimension_pair(scenario, term, names, options) for scenario, term in pairs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            results = list(pool.map(_dimension_pair, *zip(*pairs), [names] * len(pairs), [options] * len(pairs)))
+
+    networks = {}
+    for result in results:
+        networks.update(result)
+    return networks
+
+
+def version_networks(versions, temporal_scenarios, deployment_scenarios, names=None, max_workers=None):
+    """
+    Dimensioned networks of every revision: dimension_once with the engine options, plus one
+    more run, limited to the solutions that accept them, for each distinct set of revision options.
+
+    :return: Dict version name -> networks as returned by dimension_once
+    """
+    default = dimension_once(temporal_scenarios, deployment_scenarios, names, max_workers)
+    by_options = {(): default}
+    networks = {}
+    for version in versions:
+        key = tuple(sorted(version.dimensioning.items()))
+        if key not in by_options:
+            affected = [strategy.name for strategy in get_solutions(names)
+                        if set(version.dimensioning) & set(strategy.options)]
+            by_options[key] = dict(default)
+            if affected:
+                by_options[key].update(dimension_once(temporal_scenarios, deployment_scenarios, affected,
+                                                      max_workers, version.dimensioning))
+        networks[version.name] = by_options[key]
+    return networks
+
+
+def _cost(counts, prices, components):
+    return sum(prices[eq_enum] * count for eq_enum, count in counts.items()
+               if count and any(comp_type in eq_enum.name for comp_type in components))
+
+
+def price_network(version, network, prices, powers):
+    """Costs (total, TX, MUX) and energy (total, TX, SW) of a dimensioned network under a revision's prices"""
+    tx_cost = _cost(network['counts'], prices, version.tx_components)
+    mux_cost = _cost(network['counts'], prices, version.switching_components)
+    tx_energy = sum(powers[eq_enum] * coefficient for eq_enum, coefficient in network['energy_bom'].items())
+    return {
+        'Total Cost': tx_cost + mux_cost, 'Normalized Cost': (tx_cost + mux_cost) / network['area'],
+        'TX Cost': tx_cost, 'MUX Cost': mux_cost,
+        'Total Energy': tx_energy + network['switching_mwh'], 'TX Energy': tx_energy,
+        'SW Energy': network['switching_mwh']
+    }
+
+
+def version_rows(version, networks, alpha_values=None):
+    """
+    Yield (key, metrics) for every network priced under every XR case and alpha of the revision,
+    key being (Solution, Case, Alpha, Term, Scenario). Solutions without XR get one 'N/A' row
+    per revision, the XR case not affecting them.
+    """
+    settings = [(case, None) for case in version.xr_cases]
+    if alpha_values is not None and version.alpha_pricing:
+        settings += [(None, alpha) for alpha in alpha_values]
+
+    for case, alpha in settings:
+        prices, powers = version.price_vectors(case, alpha)
+        for (name, scenario, term), network in networks.items():
+            if alpha is not None:
+                case_label = 'Alpha'
+            elif not SOLUTION_REGISTRY[name].uses_xr:
+                if case != version.xr_cases[0]:
+                    continue
+                case_label = 'N/A'
+            else:
+                case_label = case.capitalize() if case is not None else 'Nominal'
+            yield (name, case_label, alpha, term, scenario), price_network(version, network, prices, powers)
+
+
+def compare_versions(temporal_scenarios, deployment_scenarios, versions=None, names=None, alpha_values=None,
+                     max_workers=None):
+    """
+    Cross-version comparison: each solution is dimensioned once per (scenario, term) and set of
+    revision dimensioning options (see version_networks), then priced under every revision, XR
+    case and (for the revisions that have it) alpha value.
+
+    :param versions: Version names (default all of MODEL_VERSIONS)
+    :param alpha_values: Optional alpha grid, rows with Case 'Alpha'
+    :return: DataFrame with Version, Solution, Case, Alpha, Term, Scenario, costs and energy
+    """
+    import pandas as pd
+
+    versions = get_versions(versions)
+    networks = version_networks(versions, temporal_scenarios, deployment_scenarios, names, max_workers)
+    records = []
+    for version in versions:
+        for (name, case, alpha, term, scenario), metrics in version_rows(version, networks[version.name],
+                                                                         alpha_values):
+            record = {'Version': version.name, 'Solution': name, 'Case': case, 'Alpha': alpha,
+                      'Term': term, 'Scenario': scenario}
+            record.update(metrics)
+            records.append(record)
+    return pd.DataFrame(records)
+
+
+def version_differences(df, reference='v12', metrics=('Total Cost', 'Total Energy')):
+    """
+    Difference of every revision from ``reference`` on the rows they share
+    (same Solution, Case, Alpha, Term and Scenario).
+    """
+    import pandas as pd
+
+    keys = ['Solution', 'Case', 'Alpha', 'Term', 'Scenario']
+    base = df[df['Version'] == reference].set_index(keys)[list(metrics)]
+    diffs = []
+    for version, rows in df[df['Version'] != reference].groupby('Version', sort=False):
+        joined = rows.set_index(keys)[list(metrics)].join(base, rsuffix=f' {reference}', how='inner')
+        for metric in metrics:
+            joined[f'Δ {metric}'] = joined[metric] - joined[f'{metric} {reference}']
+        joined.insert(0, 'Version', version)
+        diffs.append(joined.reset_index())
+    return pd.concat(diffs, ignore_index=True) if diffs else pd.DataFrame()
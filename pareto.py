@@ -0,0 +1,83 @@
+import numpy as np
+
+# Le classi di apparati campionate in modo indipendente sono quelle del catalogo dell'engine
+from engine import EQUIPMENT_CLASSES, equipment_class
+
+
+class CatalogVariants:
+    """
+    Sampled catalog variants as dense (n_variants × n_entries) price and power matrices.
+
+    Each variant scales every equipment class by one random factor for the price and one for
+    the power, so entries of the same class (e.g. all XR modules) move together, as in the
+    XR best/worst cases.
+    """
+
+    def __init__(self, entries, prices, powers, price_factors, power_factors, classes):
+        self.entries = entries
+        self.prices = prices
+        self.powers = powers
+        self.price_factors = price_factors
+        self.power_factors = power_factors
+        self.classes = classes
+
+    def __len__(self):
+        return self.prices.shape[0]
+
+    @classmethod
+    def sample(cls, catalog, n_variants, price_range=(0.5, 1.5), power_range=(0.5, 1.5),
+               classes=EQUIPMENT_CLASSES, include_nominal=True, seed=None):
+        """
+        Sample uniform per-class price and power factors around the current catalog values.
+
+        :param catalog: Dict enum -> NetworkEquipmentType
+        :param include_nominal: Keep the unscaled catalog as variant 0
+        """
+        rng = np.random.default_rng(seed)
+        entries = list(catalog)
+        entry_classes = sorted({equipment_class(eq_enum.name, classes) for eq_enum in entries})
+        class_index = np.array([entry_classes.index(equipment_class(eq_enum.name, classes)) for eq_enum in entries])
+
+        price_factors = rng.uniform(*price_range, size=(n_variants, len(entry_classes)))
+        power_factors = rng.uniform(*power_range, size=(n_variants, len(entry_classes)))
+        if include_nominal and n_variants > 0:
+            price_factors[0] = 1.0
+            power_factors[0] = 1.0
+
+        base_prices = np.array([catalog[eq_enum].normalized_price for eq_enum in entries], dtype=float)
+        base_powers = np.array([catalog[eq_enum].max_power for eq_enum in entries], dtype=float)
+        prices = price_factors[:, class_index] * base_prices
+        powers = power_factors[:, class_index] * base_powers
+        return cls(entries, prices, powers, price_factors, power_factors, entry_classes)
+
+
+def evaluate_variants(variants, cost_bom, energy_bom, switching_energy=0.0):
+    """
+    CAPEX and annual MWh of one dimensioned network under every catalog variant.
+
+    :param cost_bom: Dict enum -> ∂cost/∂price (see sensitivity.cost_gradient)
+    :param energy_bom: Dict enum -> ∂MWh/∂max_power (see sensitivity.energy_gradient)
+    :param switching_energy: Annual MWh of the switches, independent of the catalog
+    :return: (capex, energy) arrays of length n_variants
+    """
+    cost_vector = np.array([cost_bom.get(eq_enum, 0) for eq_enum in variants.entries], dtype=float)
+    energy_vector = np.array([energy_bom.get(eq_enum, 0) for eq_enum in variants.entries], dtype=float)
+    capex = variants.prices @ cost_vector
+    energy = variants.powers @ energy_vector + switching_energy
+    return capex, energy
+
+
+def pareto_front(cost, energy):
+    """
+    Boolean mask of the non-dominated points when minimizing both cost and energy.
+    Points are swept by increasing cost (ties by energy): a point is on the frontier if its
+    energy is strictly lower than every cheaper point's.
+    """
+    cost = np.asarray(cost, dtype=float)
+    energy = np.asarray(energy, dtype=float)
+    order = np.lexsort((energy, cost))
+    sorted_energy = energy[order]
+    best_before = np.minimum.accumulate(np.concatenate(([np.inf], sorted_energy[:-1])))
+    mask = np.zeros(len(cost), dtype=bool)
+    mask[order] = sorted_energy < best_before
+    return mask
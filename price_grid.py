@@ -0,0 +1,104 @@
+"""
+Broadcast price-grid evaluation.
+
+The dimensioning does not depend on the prices, so the cost of every dimensioned network is
+the dot product of its bill of materials with the price vector. With the BOMs stacked in a
+(solution × scenario × term × equipment) tensor and any number of price vectors stacked in a
+(price point × equipment) matrix, the whole cost cube is one einsum:
+
+    networks = dimension_once(temporal_scenarios, deployment_scenarios)
+    bom = bom_tensor(networks, solutions, deployment_scenarios, temporal_scenarios)
+    costs = cost_tensor(bom, alpha_price_stack(np.linspace(0.1, 3, 2000)))  # (2000, sol, scen, term)
+"""
+import numpy as np
+
+from engine import (
+    NetworkEquipmentTypeEnum,
+    network_equipment_types,
+    reset_all_costs_to_original,
+    update_xr_costs_based_on_grey_lr,
+    update_xr_equipment_scenario,
+    TX_COMPONENTS,
+    SWITCHING_COMPONENTS,
+)
+
+# Ordine delle voci di catalogo sull'ultimo asse di BOM e prezzi
+EQUIPMENT = list(NetworkEquipmentTypeEnum)
+
+
+def component_mask(components):
+    """1 for the catalog entries counted by calculate_cost_component for ``components``, else 0"""
+    return np.array([any(comp_type in eq_enum.name for comp_type in components) for eq_enum in EQUIPMENT],
+                    dtype=float)
+
+
+def bom_tensor(networks, solutions, scenarios, terms, components=TX_COMPONENTS + SWITCHING_COMPONENTS):
+    """
+    Equipment counts of dimensioned networks as a (solution, scenario, term, equipment) array.
+
+    :param networks: Dict (solution, scenario, term) -> dict with the equipment 'counts', as
+                     returned by model_versions.dimension_once
+    :param components: Name fragments of the entries that are priced (default: total cost)
+    """
+    bom = np.zeros((len(solutions), len(scenarios), len(terms), len(EQUIPMENT)))
+    for i, solution in enumerate(solutions):
+        for j, scenario in enumerate(scenarios):
+            for k, term in enumerate(terms):
+                counts = networks[(solution, scenario, term)]['counts']
+                bom[i, j, k] = [counts.get(eq_enum, 0) for eq_enum in EQUIPMENT]
+    return bom * component_mask(components)
+
+
+def price_vector(prices=None):
+    """Normalized prices in EQUIPMENT order, from a dict enum -> price or the current catalog"""
+    if prices is None:
+        prices = {eq_enum: spec.normalized_price for eq_enum, spec in network_equipment_types.items()}
+    return np.array([prices[eq_enum] for eq_enum in EQUIPMENT], dtype=float)
+
+
+def alpha_price_model():
+    """
+    Prezzi del catalogo in funzione di alpha secondo update_xr_costs_based_on_grey_lr:
+    price(alpha) = base + alpha * rate per ogni voce (rate = 0 per le voci non XR / MC).
+    """
+    reset_all_costs_to_original()
+    update_xr_costs_based_on_grey_lr(network_equipment_types, NetworkEquipmentTypeEnum, 0)
+    base = {eq_enum: spec.normalized_price for eq_enum, spec in network_equipment_types.items()}
+
+    reset_all_costs_to_original()
+    update_xr_costs_based_on_grey_lr(network_equipment_types, NetworkEquipmentTypeEnum, 1)
+    rate = {eq_enum: spec.normalized_price - base[eq_enum] for eq_enum, spec in network_equipment_types.items()}
+
+    reset_all_costs_to_original()
+    return base, rate
+
+
+def alpha_price_stack(alpha_values):
+    """(len(alpha_values), equipment) prices of the XR = GREY LR × alpha model"""
+    base, rate = alpha_price_model()
+    return price_vector(base) + np.outer(np.asarray(alpha_values, dtype=float), price_vector(rate))
+
+
+def case_price_stack(cases):
+    """(len(cases), equipment) prices of the XR catalog cases of update_xr_equipment_scenario"""
+    stack = []
+    try:
+        for case in cases:
+            reset_all_costs_to_original()
+            update_xr_equipment_scenario(network_equipment_types, NetworkEquipmentTypeEnum, case)
+            stack.append(price_vector())
+    finally:
+        reset_all_costs_to_original()
+    return np.array(stack)
+
+
+def cost_tensor(bom, price_stack):
+    """
+    Cost of every network under every price vector.
+
+    :param bom: (..., equipment) counts, e.g. from bom_tensor
+    :param price_stack: (price point, equipment) prices, or a single price vector
+    :return: (price point, ...) costs
+    """
+    price_stack = np.atleast_2d(price_stack)
+    return np.einsum('...e,pe->p...', bom, price_stack)
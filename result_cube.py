@@ -0,0 +1,216 @@
+import json
+
+import numpy as np
+
+# Canonical axes of a result cube; metric is always the last (fastest varying) axis
+CUBE_AXES = ('alpha', 'case', 'scenario', 'term', 'solution', 'trial', 'metric')
+
+# Column names used when a cube is flattened back into a DataFrame / CSV
+AXIS_COLUMNS = {
+    'alpha': 'Alpha',
+    'case': 'Case',
+    'scenario': 'Scenario',
+    'term': 'Term',
+    'solution': 'Solution',
+    'trial': 'Trial',
+}
+
+# Labels used for the axes a study does not sweep
+DEFAULT_AXIS_LABELS = {
+    'alpha': [None],
+    'case': ['N/A'],
+    'scenario': ['N/A'],
+    'term': ['N/A'],
+    'solution': ['N/A'],
+    'trial': [0],
+}
+
+
+class ResultCube:
+    """
+    Preallocated, memory-mapped N-dimensional result array with labeled axes.
+
+    Values live in ``<path>.npy`` (opened as a numpy memmap) and the axis labels in
+    ``<path>.json``, so a cube can be larger than RAM, filled point by point by a sweep
+    and reopened later for analysis. Slices returned by ``sel`` are memmap views and are
+    only read from disk when used.
+    """
+
+    def __init__(self, path, axes, data):
+        self.path = path
+        self.axes = axes
+        self.data = data
+        self._positions = {name: {_label_key(label): i for i, label in enumerate(labels)}
+                           for name, labels in axes.items()}
+
+    @classmethod
+    def create(cls, path, metric, dtype='float64', **labels):
+        """
+        Create a new cube on disk, filled with NaN.
+
+        :param path: Base path of the cube (without extension)
+        :param metric: List of metric names (last axis)
+        :param labels: Labels for the other axes (alpha, case, scenario, term, solution, trial);
+                       axes not given get a single default label
+        """
+        unknown = set(labels) - set(CUBE_AXES)
+        if unknown:
+            raise ValueError(f"Unknown cube axes: {sorted(unknown)}")
+
+        axes = {}
+        for name in CUBE_AXES:
+            if name == 'metric':
+                axes[name] = list(metric)
+            else:
+                axes[name] = list(labels.get(name, DEFAULT_AXIS_LABELS[name]))
+
+        shape = tuple(len(axes[name]) for name in CUBE_AXES)
+        data = np.lib.format.open_memmap(f"{path}.npy", mode='w+', dtype=dtype, shape=shape)
+        data[...] = np.nan
+
+        with open(f"{path}.json", 'w') as f:
+            json.dump({'axes': axes, 'dtype': str(np.dtype(dtype))}, f, indent=2)
+
+        return cls(path, axes, data)
+
+    @classmethod
+    def open(cls, path, mode='r'):
+        """Reopen an existing cube; mode 'r' is read-only, 'r+' allows further writes."""
+        with open(f"{path}.json") as f:
+            meta = json.load(f)
+        data = np.load(f"{path}.npy", mmap_mode=mode)
+        return cls(path, meta['axes'], data)
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def labels(self, axis):
+        return list(self.axes[axis])
+
+    def position(self, axis, label):
+        try:
+            return self._positions[axis][_label_key(label)]
+        except KeyError:
+            raise KeyError(f"Label {label!r} not found on axis '{axis}'") from None
+
+    def _index(self, coords):
+        unknown = set(coords) - set(CUBE_AXES)
+        if unknown:
+            raise ValueError(f"Unknown cube axes: {sorted(unknown)}")
+        return tuple(self.position(name, coords[name]) if name in coords else slice(None)
+                     for name in CUBE_AXES)
+
+    def write(self, values, **coords):
+        """
+        Store one grid point.
+
+        :param values: Dict metric -> value
+        :param coords: One label for every axis except metric (axes with a single label may be omitted)
+        """
+        for name in CUBE_AXES[:-1]:
+            if name not in coords and len(self.axes[name]) == 1:
+                coords[name] = self.axes[name][0]
+        missing = [name for name in CUBE_AXES[:-1] if name not in coords]
+        if missing:
+            raise ValueError(f"Missing coordinates for axes: {missing}")
+
+        point = self.data[self._index(coords)]
+        for metric, value in values.items():
+            point[self.position('metric', metric)] = value
+
+    def sel(self, **coords):
+        """
+        Lazy selection: returns a memmap view where every axis given in ``coords`` has been
+        fixed, the remaining axes keep the canonical order.
+        """
+        return self.data[self._index(coords)]
+
+    def along(self, axis, **coords):
+        """
+        Values along ``axis`` for the given coordinates, averaged over the Monte Carlo trials
+        if ``trial`` is left free. Returns (labels, values).
+
+        Every other axis must be fixed in ``coords`` or have a single label: averaging e.g. the
+        best and worst XR cases together would silently mix different studies.
+        """
+        if axis in coords:
+            raise ValueError(f"Axis '{axis}' cannot be both fixed and traversed")
+        ambiguous = [name for name in CUBE_AXES[:-1]
+                     if name not in coords and name not in (axis, 'trial') and len(self.axes[name]) > 1]
+        if ambiguous:
+            raise ValueError(f"Axes {ambiguous} have several labels: fix them in the coordinates")
+        view = self.sel(**coords)
+        free_axes = [name for name in CUBE_AXES if name not in coords]
+        values = np.moveaxis(np.asarray(view), free_axes.index(axis), 0)
+        values = values.reshape(values.shape[0], -1)
+        if values.shape[1] > 1:
+            values = np.nanmean(values, axis=1)
+        else:
+            values = values[:, 0]
+        return self.labels(axis), values
+
+    def flush(self):
+        if isinstance(self.data, np.memmap):
+            self.data.flush()
+
+    def iter_frames(self, drop=(), chunk_axis='alpha'):
+        """
+        Flatten the cube into long DataFrames (one column per metric), one per label of
+        ``chunk_axis``: only one slice of the memmap and of the index is in memory at a time.
+        Rows come in the same order as in ``to_frame``. Axes listed in ``drop`` must have a
+        single label and are omitted from the columns.
+        """
+        import pandas as pd
+
+        for name in drop:
+            if len(self.axes[name]) != 1:
+                raise ValueError(f"Cannot drop axis '{name}' with {len(self.axes[name])} labels")
+        if chunk_axis not in CUBE_AXES[:-1]:
+            raise ValueError(f"Cannot chunk along axis '{chunk_axis}'")
+
+        key_axes = [name for name in CUBE_AXES[:-1] if name not in drop]
+        chunk = CUBE_AXES.index(chunk_axis)
+        # Le etichette dell'asse di chunk e degli assi che lo precedono variano tra un blocco e l'altro
+        outer_axes = CUBE_AXES[:chunk + 1]
+        inner_axes = CUBE_AXES[chunk + 1:-1]
+        inner_index = pd.MultiIndex.from_product([self.axes[name] for name in inner_axes], names=list(inner_axes)) \
+            if inner_axes else None
+
+        for outer in np.ndindex(*self.data.shape[:chunk + 1]):
+            values = np.asarray(self.data[outer]).reshape(-1, len(self.axes['metric']))
+            df = pd.DataFrame(values, columns=self.axes['metric'])
+            for name, position in zip(reversed(outer_axes), reversed(outer)):
+                df.insert(0, name, [self.axes[name][position]] * len(df))
+            if inner_index is not None:
+                for level, name in enumerate(inner_axes):
+                    df.insert(len(outer_axes) + level, name, inner_index.get_level_values(level))
+            df = df.drop(columns=list(drop))
+            yield df.rename(columns={name: AXIS_COLUMNS[name] for name in key_axes})
+
+    def to_frame(self, drop=()):
+        """Whole cube as one long DataFrame (see iter_frames); use to_csv for cubes larger than RAM"""
+        import pandas as pd
+
+        return pd.concat(self.iter_frames(drop), ignore_index=True)
+
+    def to_csv(self, path, drop=(), chunk_axis='alpha', columns=None):
+        """
+        Write the long table of ``to_frame`` to CSV streaming it chunk by chunk along ``chunk_axis``.
+
+        :param columns: Columns to write, in this order (default: all)
+        """
+        header = True
+        with open(path, 'w', newline='') as f:
+            for df in self.iter_frames(drop, chunk_axis):
+                if columns is not None:
+                    df = df[list(columns)]
+                df.to_csv(f, index=False, header=header)
+                header = False
+
+
+def _label_key(label):
+    # Labels read back from JSON lose numpy scalar types; compare on plain Python values
+    if isinstance(label, np.generic):
+        return label.item()
+    return label
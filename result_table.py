@@ -0,0 +1,74 @@
+import numpy as np
+
+# Chiave di una riga di risultati: le soluzioni senza XR hanno Case 'N/A'
+TABLE_KEYS = ('Scenario', 'Term', 'Solution', 'Case')
+NO_CASE = 'N/A'
+
+
+class ResultTable:
+    """
+    Long result table (one row per scenario, term, solution and XR case) indexed for plotting.
+
+    The rows are stored under a (Scenario, Term, Solution, Case) MultiIndex, and a dict from
+    key to row position plus one array per metric make every ``value`` lookup O(1), instead
+    of a boolean scan of the whole table. ``figure_data`` gives the bars of a whole figure
+    with one cross-section and one pivot.
+
+    :param df: DataFrame with the TABLE_KEYS columns (a missing or NaN Case means 'N/A')
+    """
+
+    def __init__(self, df, keys=TABLE_KEYS):
+        if 'Case' in keys:
+            # Tabelle rilette da CSV: 'N/A' diventa NaN
+            df = df.assign(Case=df['Case'].fillna(NO_CASE) if 'Case' in df.columns else NO_CASE)
+        self.keys = list(keys)
+        self.frame = df.set_index(self.keys, verify_integrity=True)
+        self.metrics = list(self.frame.columns)
+        self._positions = {key: i for i, key in enumerate(self.frame.index)}
+        self._columns = {metric: self.frame[metric].to_numpy() for metric in self.metrics}
+
+    def __len__(self):
+        return len(self.frame)
+
+    def __contains__(self, key):
+        return tuple(key) in self._positions
+
+    def value(self, metric, scenario, term, solution, case=NO_CASE, default=0):
+        """Value of one metric, ``default`` if the row does not exist"""
+        position = self._positions.get((scenario, term, solution, case))
+        if position is None:
+            return default
+        return self._columns[metric][position]
+
+    def row(self, scenario, term, solution, case=NO_CASE):
+        """Dict metric -> value of one row"""
+        position = self._positions[(scenario, term, solution, case)]
+        return {metric: values[position] for metric, values in self._columns.items()}
+
+    def figure_data(self, scenario, bars, metrics, terms=('Medium', 'Long'), fill_value=0):
+        """
+        Plot data of one scenario: one row per bar, one column per (metric, term).
+
+            costs = table.figure_data('Urban', [('P2P', 'N/A'), ('P2MP', 'Best')], ['TX Cost', 'MUX Cost'])
+            costs['TX Cost', 'Medium']   # one value per bar
+
+        :param bars: List of (solution, case) in bar order; missing rows get ``fill_value``
+        """
+        import pandas as pd
+
+        pivot = self.frame.xs(scenario, level='Scenario')[list(metrics)].unstack('Term')
+        columns = pd.MultiIndex.from_product([list(metrics), list(terms)])
+        return pivot.reindex(index=pd.MultiIndex.from_tuples(bars, names=['Solution', 'Case']),
+                             columns=columns).fillna(fill_value)
+
+    def best_worst(self, metric, scenario, term, solutions=None):
+        """
+        Cheapest and most expensive (solution, case) rows of a scenario and term for a metric.
+
+        :return: ((solution, case), value) of the minimum and of the maximum
+        """
+        values = self.frame[metric].xs((scenario, term), level=('Scenario', 'Term'))
+        if solutions is not None:
+            values = values[values.index.get_level_values('Solution').isin(solutions)]
+        best, worst = np.argmin(values.to_numpy()), np.argmax(values.to_numpy())
+        return (values.index[best], values.iloc[best]), (values.index[worst], values.iloc[worst])
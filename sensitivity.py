@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+
+# Hours in a year and W -> MW, as in calculate_total_energy_consumption
+ANNUAL_MWH_PER_W = 365 * 24 / 1000000
+
+
+class LinearPower:
+    """
+    Power expressed as a linear combination of catalog max_power values.
+
+    While a solution dimensions the network with tagged catalog powers, every
+    ``other_consumption`` accumulator becomes a LinearPower whose coefficients are
+    the number of times each catalog entry has been counted, i.e. ∂power/∂max_power.
+    """
+
+    def __init__(self, coefficients=None, constant=0.0):
+        self.coefficients = dict(coefficients or {})
+        self.constant = constant
+
+    def __add__(self, other):
+        if isinstance(other, LinearPower):
+            coefficients = dict(self.coefficients)
+            for key, value in other.coefficients.items():
+                coefficients[key] = coefficients.get(key, 0) + value
+            return LinearPower(coefficients, self.constant + other.constant)
+        return LinearPower(self.coefficients, self.constant + other)
+
+    __radd__ = __add__
+
+    def __mul__(self, factor):
+        if isinstance(factor, LinearPower):
+            raise TypeError("LinearPower can only be scaled by a number")
+        return LinearPower({key: value * factor for key, value in self.coefficients.items()},
+                           self.constant * factor)
+
+    __rmul__ = __mul__
+
+    def value(self, catalog):
+        return self.constant + sum(catalog[key].max_power * value for key, value in self.coefficients.items())
+
+
+@contextmanager
+def tagged_max_power(catalog):
+    """
+    Temporarily replace every catalog max_power with a unit LinearPower tag.
+    Dimensioning does not depend on max_power, so the network built inside the block
+    is the same one built with the real values.
+    """
+    original = {eq_enum: spec.max_power for eq_enum, spec in catalog.items()}
+    try:
+        for eq_enum, spec in catalog.items():
+            spec.max_power = LinearPower({eq_enum: 1})
+        yield
+    finally:
+        for eq_enum, max_power in original.items():
+            catalog[eq_enum].max_power = max_power
+
+
+def cost_gradient(T, catalog, component_types):
+    """
+    ∂cost/∂normalized_price for every catalog entry: the bill of materials restricted
+    to the equipment counted by calculate_cost_component for ``component_types``.
+    """
+    gradient = dict.fromkeys(catalog, 0)
+    for node in T.nodes():
+        for equipment in T.nodes[node]['network_equipment']:
+            if any(comp_type in equipment.equipment_type.name for comp_type in component_types):
+                gradient[equipment.equipment_type] += equipment.quantity
+    return gradient
+
+
+def energy_gradient(T, catalog):
+    """
+    ∂annual energy (MWh)/∂max_power (W) for every catalog entry, from a network dimensioned
+    inside ``tagged_max_power``. Switch consumption follows the load curve of
+    calculate_switch_power_consumption and does not depend on max_power.
+    """
+    gradient = dict.fromkeys(catalog, 0.0)
+    for node in T.nodes():
+        consumption = T.nodes[node].get('other_consumption', 0)
+        if isinstance(consumption, LinearPower):
+            for eq_enum, count in consumption.coefficients.items():
+                gradient[eq_enum] += count * ANNUAL_MWH_PER_W
+    return gradient
+
+
+def tornado_data(sensitivity, catalog, attribute='normalized_price', gradient='dCost/dPrice',
+                 relative_change=0.2):
+    """
+    Tornado-chart data from a sensitivity table: output swing when each catalog entry's
+    ``attribute`` moves by ±relative_change, the others being fixed. Being the model linear
+    in prices and powers, the swing is exact.
+
+    :param sensitivity: DataFrame with an 'Equipment' column (enum name) and the ``gradient`` column
+    :return: DataFrame sorted by decreasing swing, zero-gradient entries dropped
+    """
+    df = sensitivity[sensitivity[gradient] != 0].copy()
+    base = df['Equipment'].map(lambda name: _catalog_value(catalog, name, attribute))
+    df['Base Value'] = base
+    df['Low'] = -df[gradient] * base * relative_change
+    df['High'] = df[gradient] * base * relative_change
+    df['Swing'] = (df['High'] - df['Low']).abs()
+    return df.sort_values('Swing', ascending=False).reset_index(drop=True)
+
+
+def _catalog_value(catalog, name, attribute):
+    for eq_enum, spec in catalog.items():
+        if eq_enum.name == name:
+            return getattr(spec, attribute)
+    raise KeyError(f"Equipment {name!r} not found in the catalog")
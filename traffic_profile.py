@@ -0,0 +1,88 @@
+import numpy as np
+
+HOURS_PER_YEAR = 365 * 24
+
+# Typical mobile fronthaul load relative to the busy hour, hours 0-23
+DEFAULT_DAILY_PROFILE = [0.30, 0.22, 0.17, 0.15, 0.15, 0.18, 0.28, 0.45, 0.60, 0.68, 0.72, 0.75,
+                         0.78, 0.78, 0.76, 0.76, 0.79, 0.84, 0.90, 0.95, 1.00, 0.98, 0.80, 0.50]
+
+# Day-of-week scaling, Monday-Sunday
+DEFAULT_WEEKLY_PROFILE = [1.0, 1.0, 1.0, 1.0, 1.0, 0.9, 0.85]
+
+
+def yearly_profile(daily=DEFAULT_DAILY_PROFILE, weekly=DEFAULT_WEEKLY_PROFILE, hours=HOURS_PER_YEAR,
+                   start_weekday=0):
+    """
+    Hourly load profile of one year as fraction of the peak load.
+
+    :param daily: 24 values, load of each hour of the day
+    :param weekly: 7 values, scaling of each day of the week
+    :param start_weekday: Day of the week of the first hour (0 = Monday)
+    :return: Array of ``hours`` values
+    """
+    daily = np.asarray(daily, dtype=float)
+    weekly = np.asarray(weekly, dtype=float)
+    if daily.shape != (24,) or weekly.shape != (7,):
+        raise ValueError("Daily profile needs 24 values and weekly profile 7 values")
+
+    hour = np.arange(hours)
+    day_of_week = (hour // 24 + start_weekday) % 7
+    return daily[hour % 24] * weekly[day_of_week]
+
+
+class SleepMode:
+    """
+    Low-power state entered by a device in the hours its load is at most ``threshold``
+    (fraction of its peak load): switches draw ``switch_factor`` and transceivers
+    ``transceiver_factor`` of their active power.
+    """
+
+    def __init__(self, threshold=0.2, switch_factor=0.3, transceiver_factor=0.5):
+        self.threshold = threshold
+        self.switch_factor = switch_factor
+        self.transceiver_factor = transceiver_factor
+
+
+def hourly_energy(switch_loads, static_power, power_curves, profile=None, sleep_mode=None):
+    """
+    Annual energy of a network over an hourly load profile.
+
+    The profile only takes a handful of distinct values (one per hour of the week), so every
+    power curve is evaluated on the distinct (load, hours) pairs with np.interp over all the
+    switches of the same type at once, instead of looping over the 8760 hours.
+
+    :param switch_loads: List of (curve key, peak load in Gbps), one per installed switch
+    :param static_power: Power in W of the load-independent equipment (transceivers, XR, MC, ...)
+    :param power_curves: Dict curve key -> list of (traffic Gbps, power W) points, interpolated linearly
+    :param profile: Hourly load as fraction of the peak (default yearly_profile())
+    :param sleep_mode: Optional SleepMode
+    :return: Dict with 'Switching Energy', 'Transmission Energy' and 'Total Energy' in MWh
+    """
+    if profile is None:
+        profile = yearly_profile()
+    levels, hours = np.unique(np.asarray(profile, dtype=float), return_counts=True)
+    asleep = levels <= sleep_mode.threshold if sleep_mode is not None else np.zeros(len(levels), dtype=bool)
+
+    switching_wh = 0.0
+    by_curve = {}
+    for curve_key, peak_load in switch_loads:
+        by_curve.setdefault(curve_key, []).append(peak_load)
+
+    for curve_key, peak_loads in by_curve.items():
+        traffic, power = np.array(power_curves[curve_key], dtype=float).T
+        loads = np.outer(peak_loads, levels)
+        hourly_power = np.interp(loads, traffic, power)
+        if sleep_mode is not None:
+            hourly_power[:, asleep] *= sleep_mode.switch_factor
+        switching_wh += float(hourly_power.sum(axis=0) @ hours)
+
+    active_hours = hours.sum()
+    if sleep_mode is not None:
+        active_hours = hours[~asleep].sum() + hours[asleep].sum() * sleep_mode.transceiver_factor
+    transmission_wh = float(static_power) * active_hours
+
+    return {
+        'Switching Energy': switching_wh / 1000000,
+        'Transmission Energy': transmission_wh / 1000000,
+        'Total Energy': (switching_wh + transmission_wh) / 1000000
+    }
@@ -0,0 +1,142 @@
+WAVELENGTH_POLICIES = ('first_fit', 'most_used')
+
+
+class LightpathFiber:
+    """
+    Fiber managed by a WavelengthAssigner: occupied wavelengths as an integer bitset (bit i is
+    'wavelength_i') plus the capacity carried on each, in the same dict layout as engine.Fiber.
+    """
+
+    def __init__(self, num_wavelengths=10, wavelengths=None):
+        self.occupancy = 0
+        self.wavelengths = wavelengths if wavelengths is not None else \
+            {f'wavelength_{i}': 0 for i in range(num_wavelengths)}
+
+    def pair(self):
+        """Second fiber of a duplex pair, carrying the same wavelengths in the other direction"""
+        return LightpathFiber(wavelengths=self.wavelengths)
+
+
+class _EdgeFibers:
+    # Fibre del link, bitset delle lunghezze d'onda libere su almeno una fibra e, per ogni
+    # lunghezza d'onda, la prima fibra che la ha libera (le occupazioni non vengono mai rilasciate,
+    # quindi l'indice cresce soltanto)
+    __slots__ = ('fibers', 'free', 'first_free')
+
+    def __init__(self, num_wavelengths):
+        self.fibers = []
+        self.free = 0
+        self.first_free = [0] * num_wavelengths
+
+
+class WavelengthAssigner:
+    """
+    Wavelength assignment over the fibers of a graph, shared by all the lightpaths placed on it.
+
+    Every lightpath takes one wavelength on one fiber of each edge of its path (wavelength
+    continuity). The wavelengths free along the whole path are the AND of the per-edge free
+    bitsets; the policy picks one of them ('first_fit': lowest index, 'most_used': the one
+    already used by most lightpaths). When no wavelength is free end to end, the wavelength
+    missing on the fewest edges is chosen and a fiber is added only on those edges.
+
+    :param T: Graph whose edges receive the fibers (appended to their 'fibers' list)
+    :param num_wavelengths: Wavelengths per fiber
+    :param policy: One of WAVELENGTH_POLICIES
+    :param duplex: Add fibers in pairs (the second carrying the same wavelengths), as the
+                   allocate_capacity_* functions do
+    """
+
+    def __init__(self, T, num_wavelengths=10, policy='first_fit', duplex=True):
+        if policy not in WAVELENGTH_POLICIES:
+            raise ValueError(f"Unknown wavelength assignment policy '{policy}', choose from {WAVELENGTH_POLICIES}")
+        self.T = T
+        self.num_wavelengths = num_wavelengths
+        self.policy = policy
+        self.duplex = duplex
+        self.all_free = (1 << num_wavelengths) - 1
+        self.usage = [0] * num_wavelengths
+        self.lightpaths = []  # (path, wavelength, capacity)
+        self.new_fibers = 0
+        self._edges = {}
+
+    def _edge(self, u, v):
+        edge = self._edges.get((u, v))
+        if edge is None:
+            edge = self._edges[(u, v)] = self._edges[(v, u)] = _EdgeFibers(self.num_wavelengths)
+        return edge
+
+    def _add_fiber(self, u, v, edge):
+        fiber = LightpathFiber(self.num_wavelengths)
+        edge.fibers.append(fiber)
+        edge.free = self.all_free
+
+        edge_fibers = self.T.edges[u, v].setdefault('fibers', [])
+        edge_fibers.append(fiber)
+        if self.duplex:
+            edge_fibers.append(fiber.pair())
+        self.new_fibers += 2 if self.duplex else 1
+
+    def _pick(self, candidates):
+        # candidates: bitset non vuoto
+        if self.policy == 'first_fit':
+            return (candidates & -candidates).bit_length() - 1
+        best, best_usage = None, -1
+        while candidates:
+            lowest = candidates & -candidates
+            wavelength = lowest.bit_length() - 1
+            if self.usage[wavelength] > best_usage:
+                best, best_usage = wavelength, self.usage[wavelength]
+            candidates ^= lowest
+        return best
+
+    def free_wavelengths(self, path):
+        """Bitset of the wavelengths free on every edge of the path"""
+        free = self.all_free
+        for u, v in zip(path, path[1:]):
+            free &= self._edge(u, v).free
+        return free
+
+    def assign(self, path, capacity):
+        """
+        Place one lightpath of ``capacity`` Gbps along ``path``.
+
+        :return: Index of the assigned wavelength, None for a path without edges
+        """
+        edges = [(u, v, self._edge(u, v)) for u, v in zip(path, path[1:])]
+        if not edges:
+            return None
+
+        free = self.all_free
+        for _, _, edge in edges:
+            free &= edge.free
+        if free:
+            wavelength = self._pick(free)
+        else:
+            # Lunghezza d'onda che manca sul minor numero di link: nuove fibre solo su quelli
+            missing = [sum(1 for _, _, edge in edges if not edge.free >> w & 1) for w in range(self.num_wavelengths)]
+            fewest = min(missing)
+            wavelength = self._pick(sum(1 << w for w, count in enumerate(missing) if count == fewest))
+
+        bit = 1 << wavelength
+        key = f'wavelength_{wavelength}'
+        for u, v, edge in edges:
+            if not edge.free & bit:
+                self._add_fiber(u, v, edge)
+            index = edge.first_free[wavelength]
+            fiber = edge.fibers[index]
+            fiber.occupancy |= bit
+            fiber.wavelengths[key] = capacity
+
+            index += 1
+            while index < len(edge.fibers) and edge.fibers[index].occupancy & bit:
+                index += 1
+            edge.first_free[wavelength] = index
+            if index == len(edge.fibers):
+                edge.free &= ~bit
+
+        self.usage[wavelength] += 1
+        self.lightpaths.append((tuple(path), wavelength, capacity))
+        return wavelength
+
+    def assign_all(self, path, capacities):
+        return [self.assign(path, capacity) for capacity in capacities]